@@ -58,6 +58,8 @@ ARGS_BACKTEST = [
     "exportdirectory",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_indicator_cache",
+    "backtest_incremental",
     "freqai_backtest_live_models",
     "backtest_notes",
 ]
@@ -81,6 +83,11 @@ ARGS_HYPEROPT = [
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
     "early_stop",
+    "prune_checkpoints",
+    "hyperopt_storage",
+    "hyperopt_study_name",
+    "hyperopt_resume",
+    "hyperoptexportfilename",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -259,7 +266,15 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_indicator_cache",
+        "backtest_incremental",
+        "backtest_breakdown",
+        "backtest_notes",
+    )
 ] + [
     "minimum_trade_amount",
     "targeted_trade_amount",
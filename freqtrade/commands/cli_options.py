@@ -255,6 +255,21 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_indicator_cache": Arg(
+        "--indicator-cache",
+        help="Cache populated indicators on disk and reuse them in subsequent backtests "
+        "as long as strategy, parameters and data did not change.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_incremental": Arg(
+        "--incremental",
+        help="Continue from the snapshot of the previous backtest of this strategy "
+        "and only simulate newly available candles. "
+        "Requires the strategy to set `deterministic_backtest`.",
+        action="store_true",
+        default=False,
+    ),
     # Hyperopt
     "hyperopt_path": Arg(
         "--hyperopt-path",
@@ -276,6 +291,20 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="INT",
         default=0,  # 0 to disable by default
     ),
+    "prune_checkpoints": Arg(
+        "--prune-checkpoints",
+        help="Stop epochs early if their profit at one of INT evenly spaced checkpoints is below "
+        "the median of previous epochs at the same checkpoint.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "hyperopt_resume": Arg(
+        "--resume",
+        help="Continue the latest hyperopt run (or the one given with `--hyperopt-filename`), "
+        "reusing all epochs evaluated already.",
+        action="store_true",
+        default=False,
+    ),
     "spaces": Arg(
         "--spaces",
         help="Specify which parameters to hyperopt. Space-separated list.",
@@ -336,6 +365,17 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="JOBS",
         default=-1,
     ),
+    "hyperopt_storage": Arg(
+        "--storage",
+        help="Optuna storage URL (e.g. `sqlite:///user_data/hyperopt.sqlite`). "
+        "Hyperopt processes using the same storage and study name optimize a shared study.",
+        metavar="URL",
+    ),
+    "hyperopt_study_name": Arg(
+        "--study-name",
+        help="Name of the shared study in the storage given with `--storage`.",
+        metavar="NAME",
+    ),
     "hyperopt_random_state": Arg(
         "--random-state",
         help="Set random state to some positive integer for reproducible hyperopt results.",
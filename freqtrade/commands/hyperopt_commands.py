@@ -49,10 +49,11 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
 
     if epochs and not no_details:
         sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        results = HyperoptTools.load_full_epochs(results_file, sorted_epochs[:1])[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
+        epochs = HyperoptTools.load_full_epochs(results_file, epochs)
         HyperoptTools.export_csv_file(config, epochs, export_csv)
 
 
@@ -94,7 +95,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_full_epochs(results_file, [epochs[n]])[0]
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
@@ -1,11 +1,13 @@
 # Required json-schema for user specified config
 
 from freqtrade.constants import (
+    ANALYZE_PER_EPOCH_CACHE_SIZE_DEFAULT,
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
+    INDICATOR_CACHE_SIZE_DEFAULT,
     MARGIN_MODES,
     ORDERTIF_POSSIBILITIES,
     ORDERTYPE_POSSIBILITIES,
@@ -228,6 +230,31 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_indicator_cache": {
+            "description": "Cache populated indicators on disk to speed up repeated backtests.",
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_indicator_cache_size": {
+            "description": "Maximum size of the indicator cache in MB.",
+            "type": "integer",
+            "minimum": 1,
+            "default": INDICATOR_CACHE_SIZE_DEFAULT,
+        },
+        "backtest_incremental": {
+            "description": "Extend the previous backtest of the strategy with new candles.",
+            "type": "boolean",
+            "default": False,
+        },
+        "analyze_per_epoch_cache_size": {
+            "description": (
+                "Maximum size of the in-memory indicator cache per hyperopt process "
+                "with --analyze-per-epoch in MB."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": ANALYZE_PER_EPOCH_CACHE_SIZE_DEFAULT,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
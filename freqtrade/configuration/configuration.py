@@ -327,6 +327,8 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_indicator_cache", "Parameter --indicator-cache detected ..."),
+            ("backtest_incremental", "Parameter --incremental detected ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
@@ -364,6 +366,11 @@ class Configuration:
             ("export_csv", "Parameter --export-csv detected: {}"),
             ("hyperopt_jobs", "Parameter -j/--job-workers detected: {}"),
             ("hyperopt_random_state", "Parameter --random-state detected: {}"),
+            # Storage URL may contain credentials - don't log it
+            ("hyperopt_storage", "Parameter --storage detected ..."),
+            ("hyperopt_study_name", "Parameter --study-name detected: {}"),
+            ("hyperopt_resume", "Parameter --resume detected ..."),
+            ("prune_checkpoints", "Parameter --prune-checkpoints detected: {}"),
             ("hyperopt_min_trades", "Parameter --min-trades detected: {}"),
             ("hyperopt_loss", "Using Hyperopt loss class name: {}"),
             ("hyperopt_show_index", "Parameter -n/--index detected: {}"),
@@ -18,7 +18,7 @@ from freqtrade.exceptions import ConfigurationError, OperationalException
 from freqtrade.ft_types import BacktestHistoryEntryType, BacktestResultType
 from freqtrade.misc import file_dump_json, json_load
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
-from freqtrade.persistence import LocalTrade, Trade, init_db
+from freqtrade.persistence import LocalTrade, Trade, TradeLedger, init_db
 
 
 logger = logging.getLogger(__name__)
@@ -503,13 +503,20 @@ def load_backtest_analysis_data(
             return None
 
 
-def trade_list_to_dataframe(trades: list[Trade] | list[LocalTrade]) -> pd.DataFrame:
+def trade_list_to_dataframe(
+    trades: list[Trade] | list[LocalTrade] | TradeLedger,
+) -> pd.DataFrame:
     """
     Convert list of Trade objects to pandas Dataframe
-    :param trades: List of trade objects
+    :param trades: List of trade objects, or TradeLedger (backtesting)
     :return: Dataframe with BT_DATA_COLUMNS
     """
-    df = pd.DataFrame.from_records([t.to_json(True) for t in trades], columns=BT_DATA_COLUMNS)
+    if isinstance(trades, TradeLedger):
+        df = pd.DataFrame(
+            {col: trades.column(col) for col in BT_DATA_COLUMNS}, columns=BT_DATA_COLUMNS
+        )
+    else:
+        df = pd.DataFrame.from_records([t.to_json(True) for t in trades], columns=BT_DATA_COLUMNS)
     if len(df) > 0:
         df["close_date"] = pd.to_datetime(df["close_timestamp"], unit="ms", utc=True)
         df["open_date"] = pd.to_datetime(df["open_timestamp"], unit="ms", utc=True)
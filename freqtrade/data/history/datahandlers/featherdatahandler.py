@@ -1,6 +1,6 @@
 import logging
 
-from pandas import DataFrame, read_feather, to_datetime
+from pandas import DataFrame, read_feather
 from pyarrow import dataset
 
 from freqtrade.configuration import TimeRange
@@ -46,8 +46,7 @@ class FeatherDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Rows outside of the timerange are not loaded.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -60,19 +59,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
+            return self._ohlcv_load_arrow(filename, timerange, "feather")
         except Exception as e:
             logger.exception(
                 f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
@@ -11,11 +11,17 @@ from copy import deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pyarrow as pa
 from pandas import DataFrame, to_datetime
+from pyarrow import dataset
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import (
+    DEFAULT_DATAFRAME_COLUMNS,
+    DEFAULT_TRADES_COLUMNS,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     trades_convert_types,
@@ -141,6 +147,66 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    @staticmethod
+    def _build_arrow_date_filter(date_field: pa.Field, timerange: TimeRange | None):
+        """
+        Build Arrow predicate filter for the OHLCV date column, matching trim_dataframe().
+        Supports timestamp columns and integer columns (timestamps in milliseconds).
+        :param date_field: Date field of the file schema
+        :param timerange: TimeRange to filter to
+        :return: Arrow filter expression or None if not filtered
+        """
+        if not timerange:
+            return None
+        bounds = []
+        if timerange.starttype == "date" and timerange.startdt:
+            bounds.append((timerange.startdt, True))
+        if timerange.stoptype == "date" and timerange.stopdt:
+            bounds.append((timerange.stopdt, False))
+
+        field = dataset.field(date_field.name)
+        time_filter = None
+        for bound, is_start in bounds:
+            if pa.types.is_timestamp(date_field.type):
+                if date_field.type.tz is None:
+                    bound = bound.replace(tzinfo=None)
+                value = pa.scalar(bound, type=date_field.type)
+            elif pa.types.is_integer(date_field.type):
+                value = pa.scalar(int(bound.timestamp() * 1000), type=date_field.type)
+            else:
+                return None
+            expr = field >= value if is_start else field <= value
+            time_filter = expr if time_filter is None else time_filter & expr
+        return time_filter
+
+    def _ohlcv_load_arrow(
+        self, filename: Path, timerange: TimeRange | None, file_format: str
+    ) -> DataFrame:
+        """
+        Load OHLCV data from an Arrow based (feather / parquet) file.
+        Rows outside of the timerange are filtered before converting to pandas -
+        parquet row groups outside of the timerange are skipped based on their statistics.
+        :param filename: File to load
+        :param timerange: Limit data to be loaded to this timerange
+        :param file_format: Arrow dataset format of the file
+        :return: DataFrame with ohlcv data
+        """
+        pairdataset = dataset.dataset(filename, format=file_format)
+        time_filter = self._build_arrow_date_filter(pairdataset.schema.field(0), timerange)
+        pairdata = pairdataset.to_table(filter=time_filter).to_pandas(ignore_metadata=True)
+        pairdata.columns = DEFAULT_DATAFRAME_COLUMNS
+        pairdata = pairdata.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            }
+        )
+        pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+        return pairdata
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -394,8 +460,14 @@ class IDataHandler(ABC):
         if startup_candles > 0 and timerange_startup:
             timerange_startup.subtract_start(timeframe_to_seconds(timeframe) * startup_candles)
 
+        load_timerange = timerange_startup
+        if drop_incomplete and timerange_startup and timerange_startup.stoptype:
+            # Candles after the timerange are required to detect an incomplete last candle.
+            load_timerange = deepcopy(timerange_startup)
+            load_timerange.stoptype = None
+            load_timerange.stopts = 0
         pairdf = self._ohlcv_load(
-            pair, timeframe, timerange=timerange_startup, candle_type=candle_type
+            pair, timeframe, timerange=load_timerange, candle_type=candle_type
         )
         if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data):
             return pairdf
@@ -1,6 +1,6 @@
 import logging
 
-from pandas import DataFrame, read_parquet, to_datetime
+from pandas import DataFrame, read_parquet
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -11,6 +11,9 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Rows per parquet row group - loading a timerange skips row groups outside of it.
+OHLCV_ROW_GROUP_SIZE = 50_000
+
 
 class ParquetDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
@@ -31,7 +34,9 @@ class ParquetDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=OHLCV_ROW_GROUP_SIZE
+        )
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -43,8 +48,7 @@ class ParquetDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Rows outside of the timerange are not loaded.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -57,19 +61,7 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
+            return self._ohlcv_load_arrow(filename, timerange, "parquet")
         except Exception as e:
             logger.exception(
                 f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
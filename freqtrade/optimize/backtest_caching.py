@@ -5,11 +5,12 @@ from pathlib import Path
 import rapidjson
 
 
-def get_strategy_run_id(strategy) -> str:
+def get_strategy_run_id(strategy, ignore_keys: tuple[str, ...] = ()) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignore_keys: Additional config keys to exclude from the hash.
     :return: hex string id.
     """
     digest = hashlib.sha1()  # noqa: S324
@@ -17,7 +18,7 @@ def get_strategy_run_id(strategy) -> str:
 
     # Options that have no impact on results of individual backtest.
     not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
-    for k in not_important_keys:
+    for k in not_important_keys + ignore_keys:
         if k in config:
             del config[k]
 
@@ -37,6 +38,84 @@ def get_strategy_run_id(strategy) -> str:
     return digest.hexdigest().lower()
 
 
+# Config keys which only influence trade simulation or reporting, not populate_indicators().
+INDICATOR_IGNORED_KEYS = (
+    "strategy_list",
+    "original_config",
+    "telegram",
+    "api_server",
+    "timerange",
+    "verbosity",
+    "logfile",
+    "dry_run_wallet",
+    "stake_amount",
+    "tradable_balance_ratio",
+    "available_capital",
+    "max_open_trades",
+    "minimal_roi",
+    "stoploss",
+    "trailing_stop",
+    "trailing_stop_positive",
+    "trailing_stop_positive_offset",
+    "trailing_only_offset_is_reached",
+    "use_exit_signal",
+    "exit_profit_only",
+    "exit_profit_offset",
+    "ignore_roi_if_entry_signal",
+    "ignore_buying_expired_candle_after",
+    "position_adjustment_enable",
+    "max_entry_position_adjustment",
+    "position_stacking",
+    "order_types",
+    "order_time_in_force",
+    "unfilledtimeout",
+    "entry_pricing",
+    "exit_pricing",
+    "fee",
+    "enable_protections",
+    "protections",
+    "export",
+    "exportfilename",
+    "exportdirectory",
+    "backtest_breakdown",
+    "backtest_cache",
+    "backtest_notes",
+    "backtest_indicator_cache",
+    "backtest_indicator_cache_size",
+    "backtest_incremental",
+)
+
+
+def get_strategy_indicator_id(strategy) -> str:
+    """
+    Generate a hash identifying the indicator calculation of a strategy.
+    Unlike get_strategy_run_id, config values which only influence the trade simulation
+    (timerange, stake, exit and order settings, ...) are excluded - so changing these
+    will keep the same id.
+    :param strategy: strategy object (with parameters already loaded).
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    config = deepcopy(strategy.config)
+    for k in INDICATOR_IGNORED_KEYS:
+        if k in config:
+            del config[k]
+
+    digest.update(
+        rapidjson.dumps(config, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    indicator_params = {
+        "startup_candle_count": strategy.startup_candle_count,
+        "params": {name: param.value for name, param in strategy.enumerate_parameters()},
+    }
+    digest.update(
+        rapidjson.dumps(indicator_params, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    with Path(strategy.__file__).open("rb") as fp:
+        digest.update(fp.read())
+    return digest.hexdigest().lower()
+
+
 def get_backtest_metadata_filename(filename: Path | str) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
@@ -0,0 +1,96 @@
+"""
+Storage of backtest simulation state, used to extend a backtest incrementally
+once new candles have been appended to the data.
+"""
+
+import logging
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypedDict
+
+from freqtrade.constants import Config
+from freqtrade.optimize.backtest_caching import get_strategy_run_id
+
+
+logger = logging.getLogger(__name__)
+
+BACKTEST_SNAPSHOT_DIR = "backtest_snapshots"
+BACKTEST_SNAPSHOT_VERSION = 1
+
+# Config keys which don't influence the simulation up to the snapshot date.
+INCREMENTAL_IGNORED_KEYS = (
+    "timerange",
+    "backtest_cache",
+    "backtest_breakdown",
+    "backtest_notes",
+    "export",
+    "exportfilename",
+    "exportdirectory",
+)
+
+
+class BacktestSnapshot(TypedDict):
+    version: int
+    run_id: str
+    # First candle of the backtest which created the snapshot
+    start_date: datetime
+    # Last candle processed before the snapshot was taken
+    snapshot_date: datetime
+    # Per pair: number of rows processed, and close rate of the last processed row
+    indexes: dict[str, int]
+    last_close: dict[str, float]
+    # Pickled simulation state (trades, locks, custom data, counters, wallet)
+    state: bytes
+
+
+def get_incremental_run_id(strategy) -> str:
+    """
+    Run id for incremental backtests - independent of the timerange.
+    """
+    return get_strategy_run_id(strategy, ignore_keys=INCREMENTAL_IGNORED_KEYS)
+
+
+def get_backtest_snapshot_filename(config: Config, strategy_name: str) -> Path:
+    return Path(config["user_data_dir"]) / "cache" / BACKTEST_SNAPSHOT_DIR / f"{strategy_name}.pkl"
+
+
+def dump_snapshot_state(state: dict[str, Any]) -> bytes:
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot_state(snapshot: BacktestSnapshot) -> dict[str, Any]:
+    return pickle.loads(snapshot["state"])  # noqa: S301
+
+
+def store_backtest_snapshot(filename: Path, snapshot: BacktestSnapshot) -> None:
+    """
+    Store the snapshot - replacing a potentially existing snapshot for this strategy.
+    """
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    tmp_filename = filename.with_suffix(".tmp")
+    with tmp_filename.open("wb") as fp:
+        pickle.dump(snapshot, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_filename.replace(filename)
+    logger.info(f"Stored backtest snapshot at {snapshot['snapshot_date']} to {filename}.")
+
+
+def load_backtest_snapshot(filename: Path, run_id: str) -> BacktestSnapshot | None:
+    """
+    Load a snapshot if it exists and belongs to this run id.
+    """
+    if not filename.is_file():
+        return None
+    try:
+        with filename.open("rb") as fp:
+            snapshot: BacktestSnapshot = pickle.load(fp)  # noqa: S301
+    except Exception as e:
+        logger.warning(f"Could not load backtest snapshot {filename}: {e}")
+        return None
+    if snapshot.get("version") != BACKTEST_SNAPSHOT_VERSION:
+        logger.info("Backtest snapshot was created by a different version, ignoring.")
+        return None
+    if snapshot.get("run_id") != run_id:
+        logger.info("Strategy or configuration changed since the backtest snapshot, ignoring.")
+        return None
+    return snapshot
@@ -6,8 +6,10 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime, timedelta
+from typing import Any
 
 from numpy import isnan, nan
 from pandas import DataFrame, Series
@@ -49,7 +51,18 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_snapshot import (
+    BACKTEST_SNAPSHOT_VERSION,
+    BacktestSnapshot,
+    dump_snapshot_state,
+    get_backtest_snapshot_filename,
+    get_incremental_run_id,
+    load_backtest_snapshot,
+    load_snapshot_state,
+    store_backtest_snapshot,
+)
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -73,7 +86,7 @@ from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import FtPrecise, dt_now
 from freqtrade.util.migrations import migrate_data
-from freqtrade.wallets import Wallets
+from freqtrade.wallets import BacktestWallets
 
 
 logger = logging.getLogger(__name__)
@@ -107,6 +120,20 @@ HEADERS = [
     "exit_tag",
 ]
 
+# Backtesting attributes which are part of the simulation state (for incremental backtests)
+SNAPSHOT_COUNTERS = (
+    "trade_id_counter",
+    "order_id_counter",
+    "rejected_trades",
+    "timedout_entry_orders",
+    "timedout_exit_orders",
+    "canceled_trade_entries",
+    "canceled_entry_orders",
+    "replaced_entry_orders",
+    "canceled_exit_orders",
+    "replaced_exit_orders",
+)
+
 
 class Backtesting:
     """
@@ -212,6 +239,12 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.incremental: bool = self.config.get("backtest_incremental", False)
+        # (run_id, backtest start date) when a snapshot should be captured
+        self._snapshot_request: tuple[str, datetime] | None = None
+        self._bt_snapshot: BacktestSnapshot | None = None
+        self._snapshot_offsets: dict[str, int] = {}
+        self._snapshot_last_close: dict[str, float] = {}
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -275,10 +308,13 @@ class Backtesting:
     def init_backtest(self):
         self.reset_backtest(False)
 
-        self.wallets = Wallets(self.config, self.exchange, is_backtest=True)
+        self.wallets = BacktestWallets(self.config, self.exchange)
 
         self.progress = BTProgress()
         self.abort = False
+        # Called with the current candle date by the backtest loop - returning True stops
+        # the backtest (used by hyperopt to prune epochs).
+        self.abort_callback: Callable[[datetime], bool] | None = None
 
     def _set_strategy(self, strategy: IStrategy):
         """
@@ -433,7 +469,7 @@ class Backtesting:
         """
         self.disable_database_use()
         PairLocks.reset_locks()
-        Trade.reset_trades()
+        Trade.reset_trades(use_ledger=True)
         CustomDataWrapper.reset_custom_data()
         self.rejected_trades = 0
         self.timedout_entry_orders = 0
@@ -447,16 +483,23 @@ class Backtesting:
         if enable_protections:
             self._load_protections(self.strategy)
 
-    def check_abort(self):
+    def check_abort(self, current_time: datetime | None = None):
         """
         Check if abort was requested, raise DependencyException if that's the case
-        Only applies to Interactive backtest mode (webserver mode)
+        Applies to Interactive backtest mode (webserver mode), or if abort_callback
+        requests it.
         """
-        if self.abort:
+        if self.abort or (
+            current_time is not None
+            and self.abort_callback is not None
+            and self.abort_callback(current_time)
+        ):
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(
+        self, processed: dict[str, DataFrame], analyzed: dict[str, DataFrame] | None = None
+    ) -> dict[str, tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
 
@@ -464,6 +507,7 @@ class Backtesting:
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :param analyzed: Optional dict to collect the analyzed dataframes (with signals) in
         """
 
         data: dict = {}
@@ -483,6 +527,8 @@ class Backtesting:
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
             )
+            if analyzed is not None:
+                analyzed[pair] = df_analyzed
 
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
@@ -513,6 +559,26 @@ class Backtesting:
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_signal_data(
+        self, processed: dict[str, DataFrame], signal_cache: dict[str, Any] | None
+    ) -> dict[str, tuple]:
+        """
+        Get data as lists - from signal_cache if available.
+        """
+        if not signal_cache:
+            analyzed: dict[str, DataFrame] = {}
+            data = self._get_ohlcv_as_lists(processed, analyzed)
+            if signal_cache is not None:
+                signal_cache.update(data=data, analyzed=analyzed, processed=dict(processed))
+            return data
+
+        for pair, df_analyzed in signal_cache["analyzed"].items():
+            self.dataprovider._set_cached_df(
+                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+            )
+        processed.update(signal_cache["processed"])
+        return signal_cache["data"]
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -699,7 +765,7 @@ class Backtesting:
                     entry_tag1=order_tag,
                 )
                 if pos_trade is not None:
-                    self.wallets.update()
+                    self.wallets.update_incremental(trade.pair)
                     return pos_trade
 
         if stake_amount is not None and stake_amount < 0.0:
@@ -795,7 +861,7 @@ class Backtesting:
                 trade.close(order.ft_price, show_msg=False)
 
                 LocalTrade.close_bt_trade(trade)
-            self.wallets.update()
+            self.wallets.update_incremental(pair)
             self.run_protections(pair, current_time, trade.trade_direction)
 
     def _get_exit_for_signal(
@@ -1462,6 +1528,7 @@ class Backtesting:
 
         Backtesting processing for one candle/pair.
         """
+        self.wallets.set_active_pair(pair)
         exiting_dir: LongShort | None = None
         if not self._position_stacking and len(LocalTrade.bt_trades_open_pp[pair]) > 0:
             # position_stacking not supported for now.
@@ -1472,7 +1539,7 @@ class Backtesting:
             if self.manage_open_orders(t, current_time, row):
                 # Remove trade (initial open order never filled)
                 LocalTrade.remove_bt_trade(t)
-                self.wallets.update()
+                self.wallets.update_incremental(pair)
 
         # 2. Process entries.
         # without positionstacking, we can only have one open trade per pair.
@@ -1488,7 +1555,7 @@ class Backtesting:
             if self.trade_slot_available(LocalTrade.bt_open_open_trade_count):
                 trade = self._enter_trade(pair, row, trade_dir)
                 if trade:
-                    self.wallets.update()
+                    self.wallets.update_incremental(pair)
             else:
                 self._collate_rejected(pair, row)
 
@@ -1496,7 +1563,7 @@ class Backtesting:
             # 3. Process entry orders.
             order = trade.select_order(trade.entry_side, is_open=True)
             if self._try_close_open_order(order, trade, current_time, row):
-                self.wallets.update()
+                self.wallets.update_incremental(pair)
 
             # 4. Create exit orders (if any)
             if trade.has_open_position:
@@ -1563,7 +1630,7 @@ class Backtesting:
             for pair in new_pairlist:
                 yield current_time_det, is_first, has_detail, idx, pair
 
-    def time_pair_generator(
+    def time_pair_generator(  # noqa: C901
         self,
         start_date: datetime,
         end_date: datetime,
@@ -1581,10 +1648,14 @@ class Backtesting:
         )
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        # Snapshot before the last candle, as entries are not allowed on the last candle.
+        snapshot_time = end_date if self._snapshot_request else None
 
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
-            self.check_abort()
+            self.check_abort(current_time)
+            if current_time == snapshot_time:
+                self._create_snapshot(current_time - self.timeframe_td, indexes, data)
 
             if self.dynamic_pairlist and self.pairlists:
                 self.pairlists.refresh_pairlist()
@@ -1676,8 +1747,73 @@ class Backtesting:
                 yield current_time_det, pair, row, is_last_row, trade_dir
             self.progress.increment()
 
+    def _create_snapshot(
+        self, snapshot_date: datetime, indexes: dict[str, int], data: dict[str, list[tuple]]
+    ) -> None:
+        """
+        Capture the simulation state for incremental backtests.
+        :param snapshot_date: Date of the last fully processed candle
+        :param indexes: Per pair row indexes into data (rows processed so far)
+        :param data: Per pair list of rows, as used by the backtest loop
+        """
+        if not self._snapshot_request:
+            return
+        run_id, bt_start_date = self._snapshot_request
+        state = {
+            "trades": LocalTrade.bt_trades,
+            "open_trades": LocalTrade.bt_trades_open,
+            "total_profit": LocalTrade.bt_total_profit,
+            "locks": PairLocks.locks,
+            "custom_data": CustomDataWrapper.custom_data,
+            "counters": {key: getattr(self, key) for key in SNAPSHOT_COUNTERS},
+            "wallet_total": self.wallets.get_total(self.strategy.config["stake_currency"]),
+        }
+        last_close = dict(self._snapshot_last_close)
+        for pair in data:
+            if indexes[pair] > 0:
+                last_close[pair] = data[pair][indexes[pair] - 1][CLOSE_IDX]
+        self._bt_snapshot = {
+            "version": BACKTEST_SNAPSHOT_VERSION,
+            "run_id": run_id,
+            "start_date": bt_start_date,
+            "snapshot_date": snapshot_date,
+            "indexes": {pair: self._snapshot_offsets.get(pair, 0) + indexes[pair] for pair in data},
+            "last_close": last_close,
+            "state": dump_snapshot_state(state),
+        }
+
+    def _restore_snapshot(self, snapshot: BacktestSnapshot) -> bool:
+        """
+        Restore the simulation state of a prior backtest.
+        Must run after reset_backtest().
+        :return: True if the wallet recalculated from the restored trades matches the
+            wallet of the snapshot.
+        """
+        state = load_snapshot_state(snapshot)
+        LocalTrade.bt_trades = state["trades"]
+        LocalTrade.bt_total_profit = state["total_profit"]
+        for trade in state["open_trades"]:
+            LocalTrade.add_bt_trade(trade)
+        PairLocks.locks = state["locks"]
+        CustomDataWrapper.custom_data = state["custom_data"]
+        for key, value in state["counters"].items():
+            if key in ("trade_id_counter", "order_id_counter"):
+                # Avoid id collisions when backtesting multiple strategies
+                value = max(value, getattr(self, key))
+            setattr(self, key, value)
+        self._snapshot_offsets = snapshot["indexes"]
+        self._snapshot_last_close = snapshot["last_close"]
+        self.wallets.update()
+        stake_currency = self.strategy.config["stake_currency"]
+        return abs(self.wallets.get_total(stake_currency) - state["wallet_total"]) <= 1e-8
+
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        snapshot: BacktestSnapshot | None = None,
+        signal_cache: dict[str, Any] | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1690,35 +1826,54 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param snapshot: Simulation state of a prior backtest to continue from.
+            start_date must be the snapshot date in this case.
+        :param signal_cache: Dict to keep the converted data and signals in. Filled by the first
+            call, and reused by following calls instead of generating signals again.
+            Only use this if signals don't change between calls. Enables the vectorized
+            backtest loop (see VectorizedBacktest) if the strategy supports it.
         :return: DataFrame with trades (results of backtesting)
         """
         self.reset_backtest(self.enable_protections)
+        self._snapshot_offsets = {}
+        self._snapshot_last_close = {}
+        if snapshot:
+            self._restore_snapshot(snapshot)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        data: dict = self._get_signal_data(processed, signal_cache)
 
-        # Loop timerange and get candle for each pair at that point in time
-        for (
-            current_time,
-            pair,
-            row,
-            is_last_row,
-            trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
-            if not self._can_short or trade_dir is None:
-                # No need to reverse position if shorting is disabled or there's no new signal
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-            else:
-                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
-                # a position closed and a new signal in the other direction is available.
+        vectorized = None
+        if signal_cache is not None and not snapshot and not self._snapshot_request:
+            # Signals don't change - only candles with possible events need to be processed.
+            from freqtrade.optimize.vectorized_backtest import VectorizedBacktest
+
+            vectorized = VectorizedBacktest.get(self, data, start_date, end_date, signal_cache)
+        if vectorized:
+            vectorized.run(self, start_date, end_date)
+        else:
+            # Loop timerange and get candle for each pair at that point in time
+            for (
+                current_time,
+                pair,
+                row,
+                is_last_row,
+                trade_dir,
+            ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
+                if not self._can_short or trade_dir is None:
+                    # No need to reverse position if shorting is disabled or there's no new signal
+                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                else:
+                    # Conditionally call backtest_loop a 2nd time if shorting is enabled,
+                    # a position closed and a new signal in the other direction is available.
 
-                for _ in (0, 1):
-                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    if not a or a == trade_dir:
-                        # the trade didn't close or position change is in the same direction
-                        break
+                    for _ in (0, 1):
+                        a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                        if not a or a == trade_dir:
+                            # the trade didn't close or position change is in the same direction
+                            break
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -1737,6 +1892,79 @@ class Backtesting:
             "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
         }
 
+    def _prepare_incremental_backtest(
+        self, data: dict[str, DataFrame], timerange: TimeRange
+    ) -> tuple[BacktestSnapshot, dict[str, DataFrame]] | None:
+        """
+        Load the snapshot of a prior backtest of this strategy and verify it can be continued.
+        :param data: OHLCV data (including startup candles) for the whole timerange
+        :param timerange: Backtest timerange
+        :return: Tuple of snapshot and data required to continue from the snapshot
+            (startup candles before the snapshot date and all newer candles),
+            or None if a full backtest is necessary.
+        """
+        if not self.strategy.deterministic_backtest:
+            logger.info("Strategy does not set `deterministic_backtest`, running a full backtest.")
+            return None
+        if (
+            self.config.get("freqai", {}).get("enabled", False)
+            or self.dynamic_pairlist
+            or self.config.get("export", "none") == "signals"
+        ):
+            logger.info(
+                "Incremental backtesting is not supported with FreqAI, dynamic pairlists "
+                "or signal export, running a full backtest."
+            )
+            return None
+
+        filename = get_backtest_snapshot_filename(self.config, self.strategy.get_strategy_name())
+        snapshot = load_backtest_snapshot(filename, get_incremental_run_id(self.strategy))
+        if not snapshot:
+            return None
+
+        min_date, max_date = history.get_timerange(
+            trim_dataframes(data, timerange, self.required_startup)
+        )
+        snapshot_date = snapshot["snapshot_date"]
+        if min_date != snapshot["start_date"] or max_date <= snapshot_date:
+            logger.info(
+                "Backtest start changed or no new candles available since the backtest snapshot, "
+                "running a full backtest."
+            )
+            return None
+        if set(data.keys()) != set(snapshot["indexes"].keys()):
+            logger.info("Pairlist changed since the backtest snapshot, running a full backtest.")
+            return None
+
+        tail: dict[str, DataFrame] = {}
+        for pair, df in data.items():
+            # Position of the last processed candle - which must have been the
+            # same candle in the prior backtest.
+            pos = int(df["date"].searchsorted(snapshot_date))
+            if (
+                pos >= len(df)
+                or df["date"].iloc[pos] != snapshot_date
+                or pos != self.required_startup + snapshot["indexes"][pair]
+                or df["close"].iloc[pos] != snapshot["last_close"].get(pair)
+            ):
+                logger.info(
+                    f"Data for {pair} changed since the backtest snapshot, running a full backtest."
+                )
+                return None
+            tail[pair] = df.iloc[pos - self.required_startup :]
+
+        # Verify the wallet can be restored from the snapshot trades.
+        self.reset_backtest(self.enable_protections)
+        wallet_restored = self._restore_snapshot(snapshot)
+        self.reset_backtest(self.enable_protections)
+        if not wallet_restored:
+            logger.info(
+                "Wallet balance does not match the backtest snapshot, running a full backtest."
+            )
+            return None
+        logger.info(f"Continuing backtest from snapshot at {snapshot_date}.")
+        return snapshot, tail
+
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
     ):
@@ -1746,8 +1974,18 @@ class Backtesting:
         backtest_start_time = dt_now()
         self._set_strategy(strat)
 
+        snapshot: BacktestSnapshot | None = None
+        if self.incremental and (
+            incremental := self._prepare_incremental_backtest(data, timerange)
+        ):
+            # Indicators are only calculated for the new candles (plus startup candles)
+            snapshot, data = incremental
+
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        if self.config.get("backtest_indicator_cache", False):
+            preprocessed = IndicatorCache(self.config, self.strategy).advise_all_indicators(data)
+        else:
+            preprocessed = self.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1759,17 +1997,30 @@ class Backtesting:
         # Use preprocessed_tmp for date generation (the trimmed dataframe).
         # Backtesting will re-trim the dataframes after entry/exit signal generation.
         min_date, max_date = history.get_timerange(preprocessed_tmp)
+        # When continuing from a snapshot, min_date is the snapshot date.
+        bt_start_date = snapshot["start_date"] if snapshot else min_date
         logger.info(
-            f"Backtesting with data from {min_date.strftime(DATETIME_PRINT_FORMAT)} "
+            f"Backtesting with data from {bt_start_date.strftime(DATETIME_PRINT_FORMAT)} "
             f"up to {max_date.strftime(DATETIME_PRINT_FORMAT)} "
-            f"({(max_date - min_date).days} days)."
+            f"({(max_date - bt_start_date).days} days)."
         )
+        self._bt_snapshot = None
+        if self.incremental and self.strategy.deterministic_backtest:
+            self._snapshot_request = (get_incremental_run_id(self.strategy), bt_start_date)
         # Execute backtest and store results
-        results = self.backtest(
-            processed=preprocessed,
-            start_date=min_date,
-            end_date=max_date,
-        )
+        try:
+            results = self.backtest(
+                processed=preprocessed,
+                start_date=min_date,
+                end_date=max_date,
+                snapshot=snapshot,
+            )
+        finally:
+            self._snapshot_request = None
+        if self._bt_snapshot:
+            store_backtest_snapshot(
+                get_backtest_snapshot_filename(self.config, strategy_name), self._bt_snapshot
+            )
         backtest_end_time = dt_now()
         results.update(
             {
@@ -1792,7 +2043,7 @@ class Backtesting:
             self.analysis_results["rejected"][strategy_name] = rejected
             self.analysis_results["exited"][strategy_name] = exited
 
-        return min_date, max_date
+        return bt_start_date, max_date
 
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
@@ -7,20 +7,34 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from datetime import datetime
-from math import ceil
 from pathlib import Path
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count
-from optuna.trial import FrozenTrial, Trial, TrialState
+from joblib import cpu_count, effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
+from optuna.trial import FrozenTrial, Trial, TrialState, create_trial
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
+from freqtrade.data.btanalysis import get_latest_hyperopt_file
 from freqtrade.enums import HyperoptState
+from freqtrade.exceptions import OperationalException
 from freqtrade.misc import file_dump_json, plural
-from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
+from freqtrade.optimize.hyperopt.hyperopt_optimizer import (
+    INITIAL_POINTS,
+    HyperOptimizer,
+    init_hyperopt_worker,
+    run_hyperopt_epoch,
+)
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_pruning import get_prune_thresholds
+from freqtrade.optimize.hyperopt_results_index import (
+    HyperoptResultsIndex,
+    get_epoch_summary,
+    get_index_filename,
+)
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -64,6 +78,16 @@ class Hyperopt:
         self.current_best_loss = 100
 
         self.clean_hyperopt()
+        self.results_index: HyperoptResultsIndex | None = None
+        self.resume = self.config.get("hyperopt_resume", False)
+        if self.resume:
+            self.results_file = get_latest_hyperopt_file(
+                self.results_file.parent, self.config.get("hyperoptexportfilename")
+            )
+            if not HyperoptTools._test_hyperopt_results_exist(self.results_file):
+                raise OperationalException(
+                    f"Hyperopt results file {self.results_file} not found, can't resume."
+                )
 
         self.num_epochs_saved = 0
         self.current_best_epoch: dict[str, Any] | None = None
@@ -73,6 +97,7 @@ class Hyperopt:
             self.config["use_exit_signal"] = True
 
         self.print_all = self.config.get("print_all", False)
+        self.prune_checkpoints = self.config.get("prune_checkpoints", 0)
         self.hyperopt_table_header = 0
         self.print_json = self.config.get("print_json", False)
 
@@ -87,7 +112,7 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [self.data_pickle_file, self.results_file, get_index_filename(self.results_file)]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -101,14 +126,18 @@ class Hyperopt:
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
-                epoch,
-                f,
-                default=hyperopt_serializer,
-                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
-            )
-            f.write("\n")
+        line = rapidjson.dumps(
+            epoch,
+            default=hyperopt_serializer,
+            number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+        )
+        data = f"{line}\n".encode()
+        with self.results_file.open("ab") as f:
+            offset = f.tell()
+            f.write(data)
+        if self.results_index is None:
+            self.results_index = HyperoptResultsIndex(self.results_file)
+        self.results_index.add_epoch(epoch, offset, len(data))
 
         self.num_epochs_saved += 1
         logger.debug(
@@ -119,6 +148,63 @@ class Hyperopt:
         latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
         file_dump_json(latest_filename, {"latest_hyperopt": str(self.results_file.name)}, log=False)
 
+    def resume_epochs(self) -> int:
+        """
+        Load the epochs of the results file to resume.
+        Epochs are added to the optimizer, and the best epoch as well as the epoch counters
+        are restored. An incomplete last epoch (e.g. from a killed process) is removed.
+        :return: Number of epochs loaded
+        """
+        dimensions = self.hyperopter.o_dimensions
+        # Shared studies keep all trials in the storage already
+        add_trials = not self.config.get("hyperopt_storage")
+        rebuild_index = HyperoptResultsIndex.load_epochs(self.results_file) is None
+        if rebuild_index:
+            get_index_filename(self.results_file).unlink(missing_ok=True)
+            self.results_index = HyperoptResultsIndex(self.results_file)
+
+        offset = 0
+        with self.results_file.open("r+b") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Removing incomplete last epoch from {self.results_file}.")
+                    f.truncate(offset)
+                    break
+                epoch = rapidjson.loads(line)
+                if epoch["params_dict"].keys() != dimensions.keys():
+                    raise OperationalException(
+                        f"Can't resume {self.results_file.name} - "
+                        "it was created with different spaces."
+                    )
+                if add_trials:
+                    is_pruned = epoch.get("is_pruned", False)
+                    self.opt.add_trial(
+                        create_trial(
+                            state=TrialState.PRUNED if is_pruned else TrialState.COMPLETE,
+                            value=None if is_pruned else epoch["loss"],
+                            params=epoch["params_dict"],
+                            distributions=dimensions,
+                            intermediate_values=dict(
+                                enumerate(epoch.get("intermediate_values", []))
+                            ),
+                        )
+                    )
+                if epoch["is_best"]:
+                    self.current_best_loss = epoch["loss"]
+                    self.current_best_epoch = epoch
+                if rebuild_index and self.results_index is not None:
+                    self.results_index.add_epoch(epoch, offset, len(line))
+                offset += len(line)
+                self.num_epochs_saved += 1
+
+        # Don't repeat the points sampled by the interrupted run
+        self.opt.sampler.reseed_rng()
+        logger.info(
+            f"Resuming from {self.num_epochs_saved} "
+            f"{plural(self.num_epochs_saved, 'epoch')} in '{self.results_file}'."
+        )
+        return self.num_epochs_saved
+
     def print_results(self, results: dict[str, Any]) -> None:
         """
         Log results if it is better than any previous evaluation
@@ -134,10 +220,25 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
-        """Start optimizer in a parallel way"""
-
-        return parallel(self.hyperopter.generate_optimizer_wrapped(v) for v in asked)
+    def run_optimizer_parallel(
+        self, executor: Executor | None, params: dict[str, Any]
+    ) -> Future[dict[str, Any]]:
+        """
+        Submit one epoch to the worker pool.
+        Runs the epoch in the current process if no executor is given (single job).
+        """
+        # Full stats are only needed for epochs which are printed.
+        best_loss = None if self.print_all else self.current_best_loss
+        prune_thresholds = (
+            get_prune_thresholds(self.opt, self.prune_checkpoints)
+            if self.prune_checkpoints > 0
+            else None
+        )
+        if executor is not None:
+            return executor.submit(run_hyperopt_epoch, params, best_loss, prune_thresholds)
+        future: Future[dict[str, Any]] = Future()
+        future.set_result(self.hyperopter.generate_optimizer(params, best_loss, prune_thresholds))
+        return future
 
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
@@ -150,10 +251,12 @@ class Hyperopt:
 
     def duplicate_optuna_asked_points(self, trial: Trial, asked_trials: list[FrozenTrial]) -> bool:
         asked_trials_no_dups: list[FrozenTrial] = []
-        trials_to_consider = trial.study.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
-        # Check whether we already evaluated the sampled `params`.
+        trials_to_consider = trial.study.get_trials(
+            deepcopy=False, states=[TrialState.COMPLETE, TrialState.RUNNING]
+        )
+        # Check whether we already evaluated (or are evaluating) the sampled `params`.
         for t in reversed(trials_to_consider):
-            if trial.params == t.params:
+            if trial.params == t.params and trial.number != t.number:
                 return True
         # Check whether same`params` in one batch (asked_trials). Autosampler is doing this.
         for t in asked_trials:
@@ -192,6 +295,21 @@ class Hyperopt:
 
         return asked_non_tried, [False for _ in range(len(asked_non_tried))]
 
+    def tell_result(self, trial: FrozenTrial, val: dict[str, Any]) -> None:
+        """
+        Pass the loss of an evaluated epoch to the optimizer.
+        In shared studies, the epoch's metrics are stored with the trial, so the results
+        of all participating processes are available in the storage.
+        """
+        if self.config.get("hyperopt_storage"):
+            trial.set_user_attr("ft_results_metrics", get_epoch_summary(val))
+        for step, value in enumerate(val.get("intermediate_values", [])):
+            trial.report(value, step)
+        if val.get("is_pruned"):
+            self.opt.tell(trial, state=TrialState.PRUNED)
+        else:
+            self.opt.tell(trial, val["loss"])
+
     def evaluate_result(self, val: dict[str, Any], current: int, is_random: bool):
         """
         Evaluate results returned from generate_optimizer
@@ -216,6 +334,52 @@ class Hyperopt:
 
         self._save_result(val)
 
+    def run_epochs(
+        self, executor: Executor | None, jobs: int, pbar: Any, task: Any, current: int
+    ) -> None:
+        """
+        Evaluate the remaining epochs, telling the optimizer each result as soon as it arrives.
+        :param current: Number of epochs evaluated already
+        """
+        pending: dict[Future[dict[str, Any]], tuple[FrozenTrial, bool]] = {}
+        # Keep all workers busy - ask for a new point as soon as an epoch finishes,
+        # instead of waiting for the slowest epoch of a batch.
+        epochs_asked = current
+        early_stop = False
+        while pending or (not early_stop and epochs_asked < self.total_epochs):
+            while not early_stop and len(pending) < jobs and epochs_asked < self.total_epochs:
+                epochs_asked += 1
+                asked, is_random = self.get_asked_points(
+                    n_points=1, dimensions=self.hyperopter.o_dimensions
+                )
+                if asked:
+                    future = self.run_optimizer_parallel(executor, asked[0].params)
+                    pending[future] = (asked[0], is_random[0])
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                o_ask, is_random_point = pending.pop(future)
+                val = future.result()
+                self.tell_result(o_ask, val)
+                # Use human-friendly indexes here (starting from 1)
+                current += 1
+                self.evaluate_result(val, current, is_random_point)
+                pbar.update(task, advance=1)
+                if current % jobs == 0:
+                    gc.collect()
+            self.hyperopter.handle_mp_logging()
+
+            if (
+                not early_stop
+                and self.hyperopter.es_epochs > 0
+                and self.hyperopter.es_terminator.should_terminate(self.opt)
+            ):
+                # Epochs already running are still evaluated.
+                logger.info(f"Early stopping after {current} epochs")
+                early_stop = True
+
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
         logger.info(f"Using optimizer random state: {self.random_state}")
@@ -228,67 +392,40 @@ class Hyperopt:
         logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
         self.opt = self.hyperopter.get_optimizer(self.random_state)
+        current = self.resume_epochs() if self.resume else 0
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+        executor = None
+        if jobs > 1:
+            # Workers receive the optimizer once, and only the parameters for every epoch.
+            executor = get_reusable_executor(
+                max_workers=jobs,
+                initializer=init_hyperopt_worker,
+                initargs=(self.hyperopter, self.hyperopter.get_log_queue()),
+            )
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(
-                            n_points=1, dimensions=self.hyperopter.o_dimensions
-                        )
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
-                        self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
-                        )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
-                        )
-
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        self.hyperopter.handle_mp_logging()
-                        gc.collect()
-
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+            # Define progressbar
+            with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs, completed=current)
+
+                if self.analyze_per_epoch and current < self.total_epochs:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(
+                        n_points=1, dimensions=self.hyperopter.o_dimensions
+                    )
+                    f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
+                    self.tell_result(asked[0], f_val0)
+                    current += 1
+                    self.evaluate_result(f_val0, current, is_random[0])
+                    pbar.update(task, advance=1)
+
+                self.run_epochs(executor, jobs, pbar, task, current)
 
         except KeyboardInterrupt:
             print("User interrupted..")
+            if executor is not None:
+                executor.shutdown(wait=False, kill_workers=True)
 
         if self.count_skipped_epochs > 0:
             logger.info(
@@ -296,6 +433,8 @@ class Hyperopt:
                 f"skipped due to duplicate parameters."
             )
 
+        if self.results_index is not None:
+            self.results_index.close()
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
             f"saved to '{self.results_file}'."
@@ -0,0 +1,68 @@
+"""
+In-memory cache for analyzed dataframes used by hyperopt with --analyze-per-epoch.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pandas import DataFrame
+
+from freqtrade.strategy.parameters import BaseParameter, trace_parameter_access
+
+
+logger = logging.getLogger(__name__)
+
+
+class HyperoptIndicatorCache:
+    """
+    Caches the result of analyzing the data for one set of parameter values.
+    Parameters read while analyzing are traced, so entries are keyed by the values of
+    the parameters the indicators depend on only - epochs that only vary other parameters
+    reuse the cached indicators.
+    The cache is limited by memory - least recently used entries are evicted first.
+    The most recent entry is always kept.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: Maximum size of all cached dataframes in bytes.
+        """
+        self._max_size = max_size
+        self._size = 0
+        self._counter = 0
+        # key -> (dependencies, analyzed data, size in bytes)
+        self._entries: OrderedDict[
+            int, tuple[tuple[tuple[BaseParameter, Any], ...], dict[str, DataFrame], int]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, analyze: Callable[[], dict[str, DataFrame]]) -> dict[str, DataFrame]:
+        """
+        Get the analyzed data for the current parameter values.
+        :param analyze: Callable analyzing the data - called if no matching entry exists.
+        """
+        for key, (dependencies, data, _) in reversed(self._entries.items()):
+            if all(param.value == value for param, value in dependencies):
+                self._entries.move_to_end(key)
+                return data
+
+        with trace_parameter_access() as accessed:
+            data = analyze()
+        self._add(((param, param.value) for param in accessed), data)
+        return data
+
+    def _add(
+        self, dependencies: Iterable[tuple[BaseParameter, Any]], data: dict[str, DataFrame]
+    ) -> None:
+        size = int(sum(df.memory_usage(index=True, deep=False).sum() for df in data.values()))
+        self._counter += 1
+        self._entries[self._counter] = (tuple(dependencies), data, size)
+        self._size += size
+        while self._size > self._max_size and len(self._entries) > 1:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            logger.debug("Evicted analyzed data from the indicator cache.")
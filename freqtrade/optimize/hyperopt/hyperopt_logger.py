@@ -11,9 +11,7 @@ def logging_mp_setup(log_queue: Queue, verbosity: int):
     """
     Setup logging in a child process.
     Must be called in the child process before logging.
-    log_queue MUST be passed to the child process via inheritance
-        Which essentially means that the log_queue must be a global, created in the same
-        file as Parallel is initialized.
+    log_queue is passed to the worker processes via the initializer of the process pool.
     """
     current_proc = current_process().name
     if current_proc != "MainProcess":
@@ -12,28 +12,36 @@ from pathlib import Path
 from typing import Any
 
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import dump, load
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
 from pandas import DataFrame
+from pandas.api.types import infer_dtype
 
-from freqtrade.constants import DATETIME_PRINT_FORMAT, Config
+from freqtrade.constants import (
+    ANALYZE_PER_EPOCH_CACHE_SIZE_DEFAULT,
+    DATETIME_PRINT_FORMAT,
+    Config,
+)
+from freqtrade.data.btanalysis import trade_list_to_dataframe
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
 from freqtrade.enums import HyperoptState
-from freqtrade.exceptions import OperationalException
+from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.ft_types import BacktestContentType
 from freqtrade.misc import deep_merge_dicts, round_dict
 from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import HyperoptIndicatorCache
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_pruning import EpochPruner, get_checkpoint_dates
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.optimize_reports import generate_strategy_stats, generate_summary_stats
 from freqtrade.optimize.space import (
     DimensionProtocol,
     SKDecimal,
@@ -41,6 +49,7 @@ from freqtrade.optimize.space import (
     ft_FloatDistribution,
     ft_IntDistribution,
 )
+from freqtrade.persistence import LocalTrade
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 from freqtrade.util.dry_run_wallet import get_dry_run_wallet
 
@@ -51,6 +60,9 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# DataFrame.attrs key listing the columns stored as categoricals - see _encode_data()
+ENCODED_COLUMNS_ATTR = "ft_encoded_columns"
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -62,6 +74,34 @@ optuna_samplers_dict = {
 
 log_queue: Any
 
+# Optimizer instance of a hyperopt worker process - see init_hyperopt_worker()
+_worker_optimizer: "HyperOptimizer"
+
+
+def init_hyperopt_worker(optimizer: "HyperOptimizer", queue: Any) -> None:
+    """
+    Initializer of hyperopt worker processes.
+    The optimizer (and the data it loads) stays resident in the worker,
+    so every epoch only needs to receive the parameters to evaluate.
+    """
+    global _worker_optimizer, log_queue
+    _worker_optimizer = optimizer
+    log_queue = queue
+    logging_mp_setup(
+        log_queue, logging.INFO if optimizer.config["verbosity"] < 1 else logging.DEBUG
+    )
+
+
+def run_hyperopt_epoch(
+    params_dict: dict[str, Any],
+    best_loss: float | None,
+    prune_thresholds: list[float | None] | None = None,
+) -> dict[str, Any]:
+    """
+    Evaluate one epoch in a hyperopt worker process.
+    """
+    return _worker_optimizer.generate_optimizer(params_dict, best_loss, prune_thresholds)
+
 
 class HyperOptimizer:
     """
@@ -104,6 +144,20 @@ class HyperOptimizer:
 
         self.market_change = 0.0
 
+        # Per-process caches - see _get_processed()
+        self._processed: dict[str, DataFrame] | None = None
+        self._indicator_cache = self._new_indicator_cache()
+        # Entry / exit signals only depend on parameters of these spaces.
+        # If none of them is optimized, signals are generated once per process.
+        self._signal_cache: dict[str, Any] | None = (
+            None
+            if any(
+                HyperoptTools.has_space(self.config, space)
+                for space in ("buy", "sell", "protection")
+            )
+            else {}
+        )
+
         self.es_epochs = config.get("early_stop", 0)
         if self.es_epochs > 0 and self.es_epochs < 0.2 * config.get("epochs", 0):
             logger.warning(f"Early stop epochs {self.es_epochs} lower than 20% of total epochs")
@@ -116,13 +170,30 @@ class HyperOptimizer:
     def _setup_logging_mp_workaround(self) -> None:
         """
         Workaround for logging in child processes.
-        local_queue must be a global and passed to the child process via inheritance.
+        The queue is passed to the worker processes by init_hyperopt_worker().
         """
         global log_queue
         m = Manager()
         log_queue = m.Queue()
         logger.info(f"manager queue {type(log_queue)}")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Don't send cached data to worker processes - workers load the data themselves.
+        """
+        state = self.__dict__.copy()
+        state.update({"_processed": None, "_indicator_cache": self._new_indicator_cache()})
+        if self._signal_cache is not None:
+            state["_signal_cache"] = {}
+        return state
+
+    def _new_indicator_cache(self) -> HyperoptIndicatorCache:
+        size = self.config.get("analyze_per_epoch_cache_size", ANALYZE_PER_EPOCH_CACHE_SIZE_DEFAULT)
+        return HyperoptIndicatorCache(size * 1024**2)
+
+    def get_log_queue(self) -> Any:
+        return log_queue
+
     def handle_mp_logging(self) -> None:
         """
         Handle logging from child processes.
@@ -277,17 +348,21 @@ class HyperOptimizer:
                 # noinspection PyProtectedMember
                 attr.value = params_dict[attr_name]
 
-    @delayed
-    @wrap_non_picklable_objects
-    def generate_optimizer_wrapped(self, params_dict: dict[str, Any]) -> dict[str, Any]:
-        logging_mp_setup(log_queue, logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG)
-        return self.generate_optimizer(params_dict)
-
-    def generate_optimizer(self, params_dict: dict[str, Any]) -> dict[str, Any]:
+    def generate_optimizer(
+        self,
+        params_dict: dict[str, Any],
+        best_loss: float | None = None,
+        prune_thresholds: list[float | None] | None = None,
+    ) -> dict[str, Any]:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param best_loss: Best loss known so far. If given, full strategy stats are only
+            generated for epochs improving on it - other epochs only get summary stats.
+        :param prune_thresholds: Minimum running profit per pruning checkpoint (see
+            get_prune_thresholds()). The epoch is stopped at the first checkpoint it falls
+            below the threshold.
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
         backtest_start_time = datetime.now(UTC)
@@ -338,15 +413,20 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-        if self.analyze_per_epoch:
-            # Data is not yet analyzed, rerun populate_indicators.
-            processed = self.advise_and_trim(processed)
-
-        bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+        processed = self._get_processed()
+        pruner = (
+            EpochPruner(
+                get_checkpoint_dates(self.min_date, self.max_date, len(prune_thresholds)),
+                prune_thresholds,
+            )
+            if prune_thresholds
+            else None
         )
+        bt_results = self._backtest(processed, pruner)
+        if bt_results is None:
+            return self._get_pruned_results_dict(
+                params_dict, pruner.intermediate_values if pruner else []
+            )
         backtest_end_time = datetime.now(UTC)
         bt_results.update(
             {
@@ -355,10 +435,93 @@ class HyperOptimizer:
             }
         )
         result = self._get_results_dict(
-            bt_results, self.min_date, self.max_date, params_dict, processed=processed
+            bt_results,
+            self.min_date,
+            self.max_date,
+            params_dict,
+            processed=processed,
+            best_loss=best_loss,
         )
+        if pruner is not None:
+            result["intermediate_values"] = pruner.intermediate_values
         return result
 
+    def _backtest(
+        self, processed: dict[str, DataFrame], pruner: EpochPruner | None
+    ) -> BacktestContentType | None:
+        """
+        Backtest the full timerange.
+        :return: Backtest results, None if the epoch was pruned.
+        """
+        self.backtesting.abort_callback = pruner
+        try:
+            return self.backtesting.backtest(
+                processed=processed,
+                start_date=self.min_date,
+                end_date=self.max_date,
+                signal_cache=self._signal_cache,
+            )
+        except DependencyException:
+            if pruner is None or not pruner.pruned:
+                raise
+            return None
+        finally:
+            self.backtesting.abort_callback = None
+
+    def _get_processed(self) -> dict[str, DataFrame]:
+        """
+        Get the data for one epoch.
+        Data is loaded once per process and kept resident for all following epochs.
+        With --analyze-per-epoch, indicators are only recalculated if parameters read by
+        the strategy while analyzing have values not seen in a cached prior epoch.
+        """
+        if self._processed is None:
+            with self.data_pickle_file.open("rb") as f:
+                self._processed = self._decode_data(load(f, mmap_mode="r"))
+        processed = self._processed
+        if self.analyze_per_epoch:
+            processed = self._indicator_cache.get(
+                lambda: self.advise_and_trim(self._copy_data(processed))
+            )
+        # Backtesting adds signal columns and replaces the dict items - keep the cache intact.
+        return self._copy_data(processed)
+
+    @staticmethod
+    def _copy_data(data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        return {pair: df.copy(deep=False) for pair, df in data.items()}
+
+    @staticmethod
+    def _encode_data(data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Prepare data for storage.
+        String columns are stored as categoricals - their codes can be memory-mapped by
+        all worker processes, instead of every process unpickling one object per row.
+        Columns with missing values are kept, as categoricals don't preserve None.
+        """
+        result = {}
+        for pair, df in data.items():
+            columns = [
+                col
+                for col in df.columns
+                if df[col].dtype == object and infer_dtype(df[col], skipna=False) == "string"
+            ]
+            if columns:
+                df = df.astype({col: "category" for col in columns})
+                df.attrs[ENCODED_COLUMNS_ATTR] = columns
+            result[pair] = df
+        return result
+
+    @staticmethod
+    def _decode_data(data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Restore string columns encoded by _encode_data().
+        Decoded rows reference the category strings, which are shared between rows.
+        """
+        for pair, df in data.items():
+            if columns := df.attrs.pop(ENCODED_COLUMNS_ATTR, None):
+                data[pair] = df.astype({col: object for col in columns})
+        return data
+
     def _get_results_dict(
         self,
         backtesting_results: BacktestContentType,
@@ -366,18 +529,33 @@ class HyperOptimizer:
         max_date: datetime,
         params_dict: dict[str, Any],
         processed: dict[str, DataFrame],
+        best_loss: float | None = None,
     ) -> dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
-        strat_stats = generate_strategy_stats(
-            self.pairlist,
-            self.backtesting.strategy.get_strategy_name(),
-            backtesting_results,
-            min_date,
-            max_date,
-            market_change=self.market_change,
-            is_hyperopt=True,
-        )
+        def full_stats() -> dict[str, Any]:
+            return generate_strategy_stats(
+                self.pairlist,
+                self.backtesting.strategy.get_strategy_name(),
+                backtesting_results,
+                min_date,
+                max_date,
+                market_change=self.market_change,
+                is_hyperopt=True,
+            )
+
+        # Summary stats suffice if the loss function doesn't need more,
+        # unless the epoch turns out to be a candidate for the best epoch.
+        strat_stats: dict[str, Any] | None = None
+        required_metrics = self.custom_hyperoptloss.required_metrics
+        if best_loss is not None and required_metrics is not None:
+            summary = generate_summary_stats(backtesting_results["results"], self.config)
+            if summary.keys() >= set(required_metrics):
+                strat_stats = summary
+        summary_only = strat_stats is not None
+        if strat_stats is None:
+            strat_stats = full_stats()
+
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config["stake_currency"]
         )
@@ -404,6 +582,8 @@ class HyperOptimizer:
                 backtest_stats=strat_stats,
                 starting_balance=get_dry_run_wallet(self.config),
             )
+        if summary_only and best_loss is not None and loss < best_loss:
+            strat_stats = full_stats()
         return {
             "loss": loss,
             "params_dict": params_dict,
@@ -414,6 +594,32 @@ class HyperOptimizer:
             "total_profit": total_profit,
         }
 
+    def _get_pruned_results_dict(
+        self, params_dict: dict[str, Any], intermediate_values: list[float]
+    ) -> dict[str, Any]:
+        """
+        Results of an epoch stopped early by pruning.
+        Metrics only cover the trades closed until the epoch was stopped.
+        """
+        strat_stats = generate_summary_stats(
+            trade_list_to_dataframe(LocalTrade.bt_trades), self.config
+        )
+        not_optimized = self.backtesting.strategy.get_no_optimize_params()
+        not_optimized = deep_merge_dicts(not_optimized, self._get_no_optimize_details())
+        return {
+            "loss": MAX_LOSS,
+            "is_pruned": True,
+            "intermediate_values": intermediate_values,
+            "params_dict": params_dict,
+            "params_details": self._get_params_details(params_dict),
+            "params_not_optimized": not_optimized,
+            "results_metrics": strat_stats,
+            "results_explanation": HyperoptTools.format_results_explanation_string(
+                strat_stats, self.config["stake_currency"]
+            ),
+            "total_profit": strat_stats["profit_total"],
+        }
+
     def convert_dimensions_to_optuna_space(self, s_dimensions: list[DimensionProtocol]) -> dict:
         o_dimensions: dict[str, optuna.distributions.BaseDistribution] = {}
         for original_dim in s_dimensions:
@@ -462,8 +668,60 @@ class HyperOptimizer:
                 self.es_terminator = Terminator(BestValueStagnationEvaluator(self.es_epochs))
 
         logger.info(f"Using optuna sampler {o_sampler}.")
+        if storage := self.config.get("hyperopt_storage"):
+            return self._load_shared_study(storage, sampler)
         return optuna.create_study(sampler=sampler, direction="minimize")
 
+    def _load_shared_study(self, storage: str, sampler: Any) -> optuna.Study:
+        """
+        Create or join the study shared by all hyperopt processes using the same storage.
+        """
+        study_name = self.config.get("hyperopt_study_name")
+        if not study_name:
+            raise OperationalException("`--study-name` is required when using `--storage`.")
+        study = optuna.create_study(
+            storage=storage,
+            study_name=study_name,
+            sampler=sampler,
+            direction="minimize",
+            load_if_exists=True,
+        )
+        # Storages only support optuna's own distribution classes.
+        self.o_dimensions = {
+            name: self._to_storable_distribution(dim) for name, dim in self.o_dimensions.items()
+        }
+        # Only processes optimizing the same strategy and dimensions may share a study.
+        study_attrs = {
+            "ft_strategy": self.get_strategy_name(),
+            "ft_dimensions": sorted(self.o_dimensions.keys()),
+        }
+        for key, value in study_attrs.items():
+            existing = study.user_attrs.get(key)
+            if existing is None:
+                study.set_user_attr(key, value)
+            elif existing != value:
+                raise OperationalException(
+                    f"Study {study_name} was created with different settings ({key}: {existing})."
+                )
+        logger.info(f"Joined study {study_name} with {len(study.trials)} existing trials.")
+        return study
+
+    @staticmethod
+    def _to_storable_distribution(
+        dim: optuna.distributions.BaseDistribution,
+    ) -> optuna.distributions.BaseDistribution:
+        if isinstance(dim, optuna.distributions.CategoricalDistribution):
+            return optuna.distributions.CategoricalDistribution(dim.choices)
+        if isinstance(dim, optuna.distributions.IntDistribution):
+            return optuna.distributions.IntDistribution(
+                dim.low, dim.high, log=dim.log, step=dim.step
+            )
+        if isinstance(dim, optuna.distributions.FloatDistribution):
+            return optuna.distributions.FloatDistribution(
+                dim.low, dim.high, log=dim.log, step=dim.step
+            )
+        return dim
+
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
         preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
@@ -495,6 +753,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            dump(self._encode_data(preprocessed), self.data_pickle_file)
         else:
             dump(data, self.data_pickle_file)
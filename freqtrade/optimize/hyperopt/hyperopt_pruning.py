@@ -0,0 +1,72 @@
+"""
+Median pruning of hyperopt epochs.
+"""
+
+import logging
+from datetime import datetime
+
+import numpy as np
+import optuna
+from optuna.trial import TrialState
+
+from freqtrade.persistence import LocalTrade
+
+
+logger = logging.getLogger(__name__)
+
+# Number of completed epochs required at a checkpoint before epochs are pruned there
+PRUNING_STARTUP_EPOCHS = 5
+
+
+def get_checkpoint_dates(
+    min_date: datetime, max_date: datetime, checkpoints: int
+) -> list[datetime]:
+    """
+    Dates splitting the backtest timerange into checkpoints + 1 equal parts.
+    """
+    step = (max_date - min_date) / (checkpoints + 1)
+    return [min_date + step * (i + 1) for i in range(checkpoints)]
+
+
+def get_prune_thresholds(study: optuna.Study, checkpoints: int) -> list[float | None]:
+    """
+    Median of the intermediate values of all completed epochs, per checkpoint.
+    Evaluated in the main process - workers don't have access to the study.
+    :return: Threshold per checkpoint, None if not enough epochs completed yet.
+    """
+    values: list[list[float]] = [[] for _ in range(checkpoints)]
+    for trial in study.get_trials(deepcopy=False, states=[TrialState.COMPLETE]):
+        for step, value in trial.intermediate_values.items():
+            if step < checkpoints:
+                values[step].append(value)
+    return [
+        float(np.median(step_values)) if len(step_values) >= PRUNING_STARTUP_EPOCHS else None
+        for step_values in values
+    ]
+
+
+class EpochPruner:
+    """
+    Backtesting abort callback (see Backtesting.abort_callback) for one epoch.
+    Records the running profit of closed trades at every checkpoint, and stops the backtest
+    if it's below the threshold for this checkpoint.
+    """
+
+    def __init__(self, checkpoint_dates: list[datetime], thresholds: list[float | None]) -> None:
+        self._checkpoint_dates = checkpoint_dates
+        self._thresholds = thresholds
+        self.intermediate_values: list[float] = []
+        self.pruned = False
+
+    def __call__(self, current_time: datetime) -> bool:
+        # Not called for every candle by the vectorized backtest - record all passed checkpoints.
+        value = LocalTrade.bt_total_profit
+        while (step := len(self.intermediate_values)) < len(self._checkpoint_dates) and (
+            current_time >= self._checkpoint_dates[step]
+        ):
+            self.intermediate_values.append(value)
+            threshold = self._thresholds[step]
+            if threshold is not None and value < threshold:
+                self.pruned = True
+                break
+        return self.pruned
@@ -19,6 +19,9 @@ class IHyperOptLoss(ABC):
     """
 
     timeframe: str
+    # Keys of ``backtest_stats`` used by the loss function.
+    # None provides the full strategy stats, which are expensive to generate for every epoch.
+    required_metrics: tuple[str, ...] | None = None
 
     @staticmethod
     @abstractmethod
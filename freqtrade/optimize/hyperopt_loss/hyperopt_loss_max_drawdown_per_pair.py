@@ -23,6 +23,8 @@ class MaxDrawDownPerPairHyperOptLoss(IHyperOptLoss):
     represented and therefore not optimized.
     """
 
+    required_metrics = ("results_per_pair",)
+
     @staticmethod
     def hyperopt_loss_function(backtest_stats: dict[str, Any], *args, **kwargs) -> float:
         """
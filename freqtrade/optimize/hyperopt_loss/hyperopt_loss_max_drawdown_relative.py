@@ -19,6 +19,8 @@ class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
     Less max drawdown more profit -> Lower return value
     """
 
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame, starting_balance: float, *args, **kwargs
@@ -32,6 +32,8 @@ class ShortTradeDurHyperOptLoss(IHyperOptLoss):
     Defines the default loss function for hyperopt
     """
 
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int, *args, **kwargs) -> float:
         """
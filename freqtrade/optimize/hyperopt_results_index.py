@@ -0,0 +1,157 @@
+"""
+Index of the scalar epoch metrics of a hyperopt results file.
+"""
+
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import rapidjson
+
+
+logger = logging.getLogger(__name__)
+
+# Epoch fields stored in the index
+INDEX_EPOCH_FIELDS = ("current_epoch", "loss", "is_best", "is_initial_point", "is_random")
+# results_metrics fields stored in the index - sufficient to filter and list epochs
+INDEX_METRIC_FIELDS = (
+    "total_trades",
+    "wins",
+    "draws",
+    "losses",
+    "profit_mean",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg",
+    "holding_avg_s",
+    "max_drawdown_abs",
+    "max_drawdown_account",
+)
+# Key of the position of the full epoch within the results file, (offset, length) in bytes
+INDEX_POSITION_KEY = "ft_index_position"
+
+
+def get_index_filename(results_file: Path) -> Path:
+    return results_file.with_name(f"{results_file.name}.sqlite")
+
+
+def _index_value(value: Any) -> Any:
+    """
+    Convert value to the representation used in the results file (see hyperopt_serializer).
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, str | int | float):
+        return value
+    return str(value)
+
+
+def get_epoch_summary(epoch: dict[str, Any]) -> dict[str, Any]:
+    """
+    Scalar results_metrics of an epoch, as stored in the index.
+    """
+    metrics = epoch.get("results_metrics", {})
+    return {
+        field: _index_value(metrics[field]) for field in INDEX_METRIC_FIELDS if field in metrics
+    }
+
+
+class HyperoptResultsIndex:
+    """
+    SQLite index written alongside a hyperopt results (.fthypt) file.
+    Stores the scalar fields used to filter and list epochs, as well as the position of
+    every epoch within the results file - so only the epochs needed are fully parsed.
+    """
+
+    def __init__(self, results_file: Path) -> None:
+        self._filename = get_index_filename(results_file)
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._filename)
+            # The index can be rebuilt from the results file - durability is not required.
+            self._conn.execute("PRAGMA synchronous = OFF")
+            columns = ", ".join(f'"{col}"' for col in INDEX_EPOCH_FIELDS + INDEX_METRIC_FIELDS)
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS epochs ("offset" INTEGER, "length" INTEGER, {columns})'
+            )
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def add_epoch(self, epoch: dict[str, Any], offset: int, length: int) -> None:
+        """
+        Add one epoch, stored at offset (with length bytes) in the results file.
+        """
+        metrics = epoch.get("results_metrics", {})
+        values = [_index_value(epoch.get(field)) for field in INDEX_EPOCH_FIELDS]
+        values += [_index_value(metrics.get(field)) for field in INDEX_METRIC_FIELDS]
+        conn = self._connect()
+        conn.execute(
+            f"INSERT INTO epochs VALUES ({', '.join('?' * (len(values) + 2))})",
+            [offset, length, *values],
+        )
+        conn.commit()
+
+    @staticmethod
+    def load_epochs(results_file: Path) -> list[dict[str, Any]] | None:
+        """
+        Load the indexed fields of all epochs.
+        Epochs are returned in the format of the results file, containing only the indexed
+        fields. Use load_full_epochs() to get the full epochs.
+        :return: List of epochs, None if the index is missing or doesn't match the results file
+        """
+        filename = get_index_filename(results_file)
+        if not filename.is_file():
+            return None
+        try:
+            with closing(sqlite3.connect(filename)) as conn:
+                rows = conn.execute('SELECT * FROM epochs ORDER BY "offset"').fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read hyperopt results index {filename}: {e}")
+            return None
+
+        # Every epoch must be indexed
+        if sum(row[1] for row in rows) != results_file.stat().st_size:
+            logger.info(f"Hyperopt results index {filename} is outdated, ignoring.")
+            return None
+
+        metrics_start = 2 + len(INDEX_EPOCH_FIELDS)
+        epochs = []
+        for row in rows:
+            epoch = dict(zip(INDEX_EPOCH_FIELDS, row[2:metrics_start], strict=True))
+            epoch["results_metrics"] = {
+                field: value
+                for field, value in zip(INDEX_METRIC_FIELDS, row[metrics_start:], strict=True)
+                if value is not None
+            }
+            for field in ("is_best", "is_initial_point", "is_random"):
+                epoch[field] = bool(epoch[field])
+            epoch[INDEX_POSITION_KEY] = (row[0], row[1])
+            epochs.append(epoch)
+        return epochs
+
+    @staticmethod
+    def load_full_epochs(results_file: Path, epochs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Load the full epochs from the results file.
+        Epochs which aren't loaded from the index are returned unchanged.
+        """
+        if not any(INDEX_POSITION_KEY in epoch for epoch in epochs):
+            return epochs
+        result = []
+        with results_file.open("rb") as f:
+            for epoch in epochs:
+                if INDEX_POSITION_KEY in epoch:
+                    offset, length = epoch[INDEX_POSITION_KEY]
+                    f.seek(offset)
+                    epoch = rapidjson.loads(f.read(length))
+                result.append(epoch)
+        return result
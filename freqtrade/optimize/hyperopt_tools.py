@@ -14,6 +14,7 @@ from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_dict, safe_value_fallback2
 from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_results_index import HyperoptResultsIndex
 
 
 logger = logging.getLogger(__name__)
@@ -164,16 +165,22 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded."
-                )
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
+        indexed_epochs = HyperoptResultsIndex.load_epochs(results_file)
+        if indexed_epochs is not None:
+            # Epochs only contain indexed fields - see load_full_epochs()
+            epochs = indexed_epochs
+            total_epochs = len(epochs)
+        else:
+            epochs = []
+            total_epochs = 0
+            for epochs_tmp in HyperoptTools._read_results(results_file):
+                if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
+                    raise OperationalException(
+                        "The file with HyperoptTools results is incompatible with this version "
+                        "of Freqtrade and cannot be loaded."
+                    )
+                total_epochs += len(epochs_tmp)
+                epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
 
         logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
 
@@ -182,6 +189,13 @@ class HyperoptTools:
 
         return epochs, total_epochs
 
+    @staticmethod
+    def load_full_epochs(results_file: Path, epochs: list) -> list:
+        """
+        Load complete epochs returned by load_filtered_results().
+        """
+        return HyperoptResultsIndex.load_full_epochs(results_file, epochs)
+
     @staticmethod
     def show_epoch_details(
         results,
@@ -0,0 +1,262 @@
+"""
+Persistent on-disk cache for populated indicator dataframes used by backtesting.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import rapidjson
+from pandas import DataFrame, RangeIndex
+from pyarrow import feather
+
+from freqtrade.constants import INDICATOR_CACHE_SIZE_DEFAULT, Config
+from freqtrade.data.history import get_datahandler, load_pair_history
+from freqtrade.enums import CandleType
+from freqtrade.optimize.backtest_caching import get_strategy_indicator_id
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.strategy_validation import StrategyResultValidator
+
+
+logger = logging.getLogger(__name__)
+
+INDICATOR_CACHE_DIR = "indicator_cache"
+INDICATOR_CACHE_EXT = "feather"
+
+
+class IndicatorCache:
+    """
+    Caches the result of ``advise_indicators()`` per pair as uncompressed feather files.
+    Indicators are calculated on the full data file of the pair, so entries can be
+    reused for any timerange by slicing the cached dataframe.
+    Entries are keyed by the strategy's indicator id (see ``get_strategy_indicator_id``),
+    the pair / timeframe and the source data file.
+    Strategies using informative pairs are cached per timerange instead, as informative
+    data is only available for the backtest timerange.
+    The total size of the cache directory is limited - least recently used entries are
+    removed first.
+    """
+
+    def __init__(self, config: Config, strategy: IStrategy) -> None:
+        self._config = config
+        self._strategy = strategy
+        self._cache_dir = Path(config["user_data_dir"]) / "cache" / INDICATOR_CACHE_DIR
+        self._max_size = (
+            config.get("backtest_indicator_cache_size", INDICATOR_CACHE_SIZE_DEFAULT) * 1024**2
+        )
+        self._timeframe = config["timeframe"]
+        self._candle_type = config.get("candle_type_def", CandleType.SPOT)
+        self._datahandler = get_datahandler(config["datadir"], config.get("dataformat_ohlcv"))
+        self.enabled = self._is_supported()
+        self._strategy_id = ""
+        # Calculate indicators on the full data file (reusable across timeranges)
+        self._full_history = True
+        if self.enabled:
+            self._strategy_id = self._build_strategy_id()
+
+    def _is_supported(self) -> bool:
+        """
+        Detect configurations where indicators depend on more than the candle data of the pair.
+        """
+        if self._config.get("freqai", {}).get("enabled", False):
+            logger.info("Indicator cache is not supported in combination with FreqAI.")
+            return False
+        if self._config.get("exchange", {}).get("use_public_trades", False):
+            logger.info("Indicator cache is not supported in combination with public trades.")
+            return False
+        return True
+
+    def _file_signature(self, pair: str, timeframe: str, candle_type: CandleType) -> list:
+        filename = self._datahandler._pair_data_filename(
+            self._datahandler._datadir, pair, timeframe, candle_type
+        )
+        try:
+            stat = filename.stat()
+        except OSError:
+            return [filename.name, None, None]
+        return [filename.name, stat.st_size, stat.st_mtime_ns]
+
+    def _build_strategy_id(self) -> str:
+        """
+        Combine the strategy indicator id with the state of all informative data files,
+        as populate_indicators() may merge these into every pair.
+        """
+        informative = sorted(
+            self._strategy.gather_informative_pairs(), key=lambda x: (x[0], x[1], str(x[2]))
+        )
+        if not informative:
+            return get_strategy_indicator_id(self._strategy)
+        self._full_history = False
+        digest = hashlib.sha1(get_strategy_indicator_id(self._strategy).encode())  # noqa: S324
+        signature = {
+            "timerange": self._config.get("timerange"),
+            "informative": [self._file_signature(*inf) for inf in informative],
+        }
+        digest.update(rapidjson.dumps(signature, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_key(self, pair: str, dataframe: DataFrame) -> str:
+        digest = hashlib.sha1(self._strategy_id.encode())  # noqa: S324
+        signature: dict = {
+            "pair": pair,
+            "timeframe": self._timeframe,
+            "candle_type": self._candle_type,
+            "file": self._file_signature(pair, self._timeframe, self._candle_type),
+        }
+        if not self._full_history:
+            signature.update(
+                {
+                    "rows": len(dataframe),
+                    "columns": list(dataframe.columns),
+                    "start": dataframe["date"].iloc[0].value if len(dataframe) else None,
+                    "end": dataframe["date"].iloc[-1].value if len(dataframe) else None,
+                }
+            )
+        digest.update(rapidjson.dumps(signature, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_full_history(self, pair: str) -> DataFrame:
+        return load_pair_history(
+            pair=pair,
+            timeframe=self._timeframe,
+            datadir=self._config["datadir"],
+            data_handler=self._datahandler,
+            candle_type=self._candle_type,
+        )
+
+    @staticmethod
+    def _slice(cached: DataFrame, dataframe: DataFrame) -> DataFrame | None:
+        """
+        Select the rows of the input dataframe from the indicators of the full data file.
+        :return: Sliced dataframe, or None if the input dataframe is not part of the cached data.
+        """
+        if dataframe.empty:
+            return None
+        dates = cached["date"]
+        start = int(dates.searchsorted(dataframe["date"].iloc[0]))
+        end = start + len(dataframe)
+        if (
+            end > len(cached)
+            or dates.iloc[start] != dataframe["date"].iloc[0]
+            or dates.iloc[end - 1] != dataframe["date"].iloc[-1]
+        ):
+            return None
+        return cached.iloc[start:end].reset_index(drop=True)
+
+    def _entry_filename(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.{INDICATOR_CACHE_EXT}"
+
+    def load(self, pair: str, dataframe: DataFrame) -> DataFrame | None:
+        """
+        Load cached indicators for this pair.
+        :param pair: Pair the dataframe belongs to
+        :param dataframe: Input OHLCV dataframe, as passed to advise_indicators()
+        :return: Dataframe with indicators, or None if not cached.
+        """
+        filename = self._entry_filename(self._entry_key(pair, dataframe))
+        if not filename.is_file():
+            return None
+        try:
+            df = feather.read_table(filename).to_pandas()
+        except Exception as e:
+            logger.warning(f"Could not read indicator cache entry {filename.name}: {e}")
+            filename.unlink(missing_ok=True)
+            return None
+        # Update modification time to keep track of recently used entries.
+        os.utime(filename)
+        return df
+
+    def store(self, pair: str, dataframe: DataFrame, result: DataFrame) -> None:
+        """
+        Store indicators for this pair.
+        :param pair: Pair the dataframe belongs to
+        :param dataframe: Input OHLCV dataframe, as passed to advise_indicators()
+        :param result: Dataframe with populated indicators
+        """
+        index = result.index
+        if not (isinstance(index, RangeIndex) and index.start == 0 and index.step == 1):
+            logger.debug(f"Not caching indicators for {pair} due to a non-default index.")
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        filename = self._entry_filename(self._entry_key(pair, dataframe))
+        tmp_filename = filename.with_suffix(".tmp")
+        try:
+            result.to_feather(tmp_filename, compression="uncompressed")
+            tmp_filename.replace(filename)
+        except Exception as e:
+            logger.warning(f"Could not store indicators for {pair} in the cache: {e}")
+            tmp_filename.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits into the configured size.
+        """
+        if not self._cache_dir.is_dir():
+            return
+        entries = []
+        for file in self._cache_dir.glob(f"*.{INDICATOR_CACHE_EXT}"):
+            stat = file.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+        total_size = sum(e[1] for e in entries)
+        removed = 0
+        for _, size, file in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self._max_size:
+                break
+            file.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+        if removed:
+            logger.info(f"Removed {removed} entries from the indicator cache.")
+
+    def _calculate(self, missing: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Calculate and store indicators for pairs missing from the cache.
+        """
+        if not self._full_history:
+            calculated = self._strategy.advise_all_indicators(missing)
+            for pair, result in calculated.items():
+                self.store(pair, missing[pair], result)
+            return calculated
+
+        full_data = {pair: self._load_full_history(pair) for pair in missing}
+        calculated = self._strategy.advise_all_indicators(full_data)
+        res: dict[str, DataFrame] = {}
+        for pair, result in calculated.items():
+            self.store(pair, missing[pair], result)
+            sliced = self._slice(result, missing[pair])
+            if sliced is None:
+                # Loaded data does not match the data file (e.g. modified dataframe)
+                sliced = self._strategy.advise_all_indicators({pair: missing[pair]})[pair]
+            res[pair] = sliced
+        return res
+
+    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Cache-aware replacement for ``IStrategy.advise_all_indicators()``.
+        Pairs missing from the cache are calculated by the strategy and stored afterwards.
+        """
+        if not self.enabled:
+            return self._strategy.advise_all_indicators(data)
+
+        res: dict[str, DataFrame] = {}
+        missing: dict[str, DataFrame] = {}
+        for pair, pair_data in data.items():
+            cached = self.load(pair, pair_data)
+            if cached is not None and self._full_history:
+                cached = self._slice(cached, pair_data)
+            if cached is not None:
+                validator = StrategyResultValidator(
+                    pair_data, warn_only=not self._strategy.disable_dataframe_checks
+                )
+                validator.assert_df(cached)
+                res[pair] = cached
+            else:
+                missing[pair] = pair_data
+
+        logger.info(f"Loaded indicators for {len(res)} of {len(data)} pairs from cache.")
+        if missing:
+            res.update(self._calculate(missing))
+            self.evict()
+        # Keep the original pair order
+        return {pair: res[pair] for pair in data if pair in res}
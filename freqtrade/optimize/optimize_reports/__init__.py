@@ -20,6 +20,7 @@ from freqtrade.optimize.optimize_reports.optimize_reports import (
     generate_rejected_signals,
     generate_strategy_comparison,
     generate_strategy_stats,
+    generate_summary_stats,
     generate_tag_metrics,
     generate_trade_signal_candles,
     generate_trading_stats,
@@ -6,7 +6,7 @@ from typing import Any, Literal
 import numpy as np
 from pandas import DataFrame, Series, concat, to_datetime
 
-from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
+from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT, Config
 from freqtrade.data.metrics import (
     calculate_cagr,
     calculate_calmar,
@@ -461,6 +461,57 @@ def generate_daily_stats(results: DataFrame) -> dict[str, Any]:
     }
 
 
+def generate_summary_stats(results: DataFrame, config: Config) -> dict[str, Any]:
+    """
+    Generate the summary of a backtest as shown for every hyperopt epoch.
+    Values match the corresponding keys of generate_strategy_stats(), but avoid
+    building per-pair, per-tag and daily stats.
+    :param results: Backtest results dataframe
+    :param config: Configuration used for the backtest
+    :return: Dictionary containing a subset of the strategy stats.
+    """
+    start_balance = get_dry_run_wallet(config)
+    trade_count = len(results)
+    profit_ratio = results["profit_ratio"]
+    profit_total_abs = results["profit_abs"].sum()
+    holding_avg = (
+        timedelta(minutes=round(results["trade_duration"].mean())) if trade_count else timedelta()
+    )
+    wins = int((profit_ratio > 0).sum())
+    trade_count_short = int(results["is_short"].sum())
+
+    stats = {
+        "total_trades": trade_count,
+        "trade_count_long": trade_count - trade_count_short,
+        "trade_count_short": trade_count_short,
+        "wins": wins,
+        "losses": int((profit_ratio < 0).sum()),
+        "draws": int((profit_ratio == 0).sum()),
+        "winrate": wins / trade_count if trade_count else 0.0,
+        "profit_mean": profit_ratio.mean() if trade_count else 0,
+        "profit_median": profit_ratio.median() if trade_count else 0,
+        "profit_total": profit_total_abs / start_balance,
+        "profit_total_abs": profit_total_abs,
+        "holding_avg": holding_avg,
+        "holding_avg_s": holding_avg.total_seconds(),
+        "stake_currency": config["stake_currency"],
+        "starting_balance": start_balance,
+    }
+    try:
+        drawdown = calculate_max_drawdown(
+            results, value_col="profit_abs", starting_balance=start_balance
+        )
+        stats.update(
+            {
+                "max_drawdown_account": drawdown.relative_account_drawdown,
+                "max_drawdown_abs": drawdown.drawdown_abs,
+            }
+        )
+    except ValueError:
+        stats.update({"max_drawdown_account": 0.0, "max_drawdown_abs": 0.0})
+    return stats
+
+
 def generate_strategy_stats(
     pairlist: list[str],
     strategy: str,
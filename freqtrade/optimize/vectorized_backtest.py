@@ -0,0 +1,314 @@
+"""
+Vectorized backtest loop, used by hyperopt while entry / exit signals don't change between epochs.
+"""
+
+import heapq
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from freqtrade.enums import TradingMode
+from freqtrade.optimize.backtesting import (
+    DATE_IDX,
+    ELONG_IDX,
+    HIGH_IDX,
+    LONG_IDX,
+    LOW_IDX,
+)
+from freqtrade.persistence import LocalTrade
+from freqtrade.resolvers.strategy_resolver import check_override
+from freqtrade.strategy.interface import IStrategy
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+
+
+logger = logging.getLogger(__name__)
+
+# Callbacks which can act on candles without ROI, stoploss or exit signal
+UNSUPPORTED_CALLBACKS = (
+    "bot_loop_start",
+    "custom_entry_price",
+    "custom_exit_price",
+    "adjust_order_price",
+    "adjust_entry_price",
+    "adjust_exit_price",
+)
+# Tolerances for the candle searches - these only select candidate candles, which are then
+# evaluated by the backtesting engine. Profit ratios are rounded to 8 decimals.
+PRICE_EPS = 1e-9
+PROFIT_EPS = 1e-7
+# Number of candles searched at once - grows while no candidate is found
+SEARCH_CHUNK_MIN = 64
+SEARCH_CHUNK_MAX = 16384
+
+
+class PairArrays(NamedTuple):
+    rows: list[tuple]
+    offset: int  # Candle index of the first row
+    dates: np.ndarray  # candle dates in seconds
+    high: np.ndarray
+    low: np.ndarray
+    exit_signal: np.ndarray
+    entry_rows: np.ndarray  # Indexes of rows with a long entry signal
+
+
+def get_unsupported_reason(backtesting: "Backtesting") -> str | None:
+    """
+    Check if the current strategy settings can be backtested with VectorizedBacktest.
+    :return: Reason why the full backtest loop is required, None if supported.
+    """
+    strategy = backtesting.strategy
+    if backtesting.trading_mode != TradingMode.SPOT or backtesting._can_short:
+        return "trading modes other than spot"
+    if backtesting._position_stacking:
+        return "position stacking"
+    if backtesting.timeframe_detail:
+        return "timeframe-detail"
+    if backtesting.dynamic_pairlist:
+        return "dynamic pairlists"
+    if strategy.use_custom_stoploss or strategy.use_custom_roi:
+        return "custom stoploss / custom roi"
+    if strategy.position_adjustment_enable:
+        return "position adjustment"
+    callbacks = UNSUPPORTED_CALLBACKS + (("custom_exit",) if strategy.use_exit_signal else ())
+    overridden = [cb for cb in callbacks if check_override(strategy, IStrategy, cb)]
+    if overridden:
+        return f"the callbacks {', '.join(overridden)}"
+    return None
+
+
+class VectorizedBacktest:
+    """
+    Backtest loop which only evaluates candles where something can happen.
+    Candles with an entry signal, and candles where an open trade may hit its ROI,
+    its stoploss (or raise its trailing stoploss) or get an exit signal are found with
+    vectorized searches over the candle arrays. Only these candles are processed by
+    Backtesting.backtest_loop() - in the same order as the full loop would process them.
+    All other candles can't change the backtest state (apart from the trade's max / min rate),
+    so results are identical to the full backtest loop.
+    """
+
+    def __init__(self, data: dict[str, list[tuple]], pairs: dict[str, PairArrays]) -> None:
+        self._pair_list = list(data.keys())
+        self._pairs = pairs
+        # Set per run - strategy parameters change between epochs
+        self._strategy: IStrategy
+        self._roi_minutes = np.array([])
+        self._roi_values = np.array([])
+
+    @staticmethod
+    def from_data(
+        data: dict[str, list[tuple]], start_date: datetime, end_date: datetime, timeframe_secs: int
+    ) -> "VectorizedBacktest | str":
+        """
+        Convert the backtest data to arrays.
+        :return: VectorizedBacktest, or the reason why the data is not supported.
+        """
+        first_ts = start_date.timestamp() + timeframe_secs
+        pairs: dict[str, PairArrays] = {}
+        for pair, rows in data.items():
+            if not rows:
+                continue
+            dates = np.array([row[DATE_IDX].timestamp() for row in rows])
+            # Rows must be consecutive candles of the backtest loop.
+            offset, remainder = divmod(dates[0] - first_ts, timeframe_secs)
+            if (
+                offset < 0
+                or remainder != 0
+                or dates[-1] > end_date.timestamp()
+                or (len(dates) > 1 and not np.all(np.diff(dates) == timeframe_secs))
+            ):
+                return f"gaps in the data of {pair}"
+            columns = np.array([row[HIGH_IDX : ELONG_IDX + 1] for row in rows], dtype=float)
+            enter_long = columns[:, LONG_IDX - HIGH_IDX] == 1
+            exit_long = columns[:, ELONG_IDX - HIGH_IDX] == 1
+            pairs[pair] = PairArrays(
+                rows=rows,
+                offset=int(offset),
+                dates=dates,
+                high=columns[:, 0],
+                low=columns[:, LOW_IDX - HIGH_IDX],
+                exit_signal=exit_long,
+                # Same as Backtesting.check_for_trade_entry() for long only
+                entry_rows=np.flatnonzero(enter_long & ~exit_long),
+            )
+        return VectorizedBacktest(data, pairs)
+
+    @staticmethod
+    def get(
+        backtesting: "Backtesting",
+        data: dict[str, list[tuple]],
+        start_date: datetime,
+        end_date: datetime,
+        signal_cache: dict[str, Any],
+    ) -> "VectorizedBacktest | None":
+        """
+        Get the VectorizedBacktest for this data from the signal cache, if it can be used.
+        """
+        if "vectorized" not in signal_cache:
+            signal_cache["vectorized"] = VectorizedBacktest.from_data(
+                data, start_date, end_date, backtesting.timeframe_secs
+            )
+            signal_cache["vectorized_logged"] = set()
+        vectorized = signal_cache["vectorized"]
+        reason = vectorized if isinstance(vectorized, str) else get_unsupported_reason(backtesting)
+        if reason is not None:
+            if reason not in signal_cache["vectorized_logged"]:
+                signal_cache["vectorized_logged"].add(reason)
+                logger.info(f"Vectorized backtesting is not supported with {reason}.")
+            return None
+        return vectorized
+
+    def _find_exit_candidate(self, arrays: PairArrays, trade: LocalTrade, start: int) -> int:
+        """
+        Find the first candle from start on where the open trade may exit or
+        adjust its trailing stoploss.
+        :return: Row index, or the number of rows if there's none.
+        """
+        strategy = self._strategy
+        count = len(arrays.dates)
+        if trade.stop_loss is None or trade.has_open_orders:
+            return start
+
+        stop_loss = trade.stop_loss * (1 + PRICE_EPS)
+        open_ts = trade.open_date_utc.timestamp()
+        # Price at which the profit ratio (including fees) is 0
+        breakeven = trade.open_rate * (1 + trade.fee_open) / (1 - (trade.fee_close or 0.0))
+        chunk = SEARCH_CHUNK_MIN
+        while start < count:
+            end = min(count, start + chunk)
+            high = arrays.high[start:end]
+            candidates = arrays.low[start:end] <= stop_loss
+            if self._roi_minutes.size:
+                duration = (arrays.dates[start:end] - open_ts) // 60
+                roi_idx = np.searchsorted(self._roi_minutes, duration, side="right") - 1
+                roi = np.where(roi_idx >= 0, self._roi_values[np.maximum(roi_idx, 0)], np.inf)
+                candidates |= high >= breakeven * (1 + roi - PROFIT_EPS)
+            if strategy.use_exit_signal:
+                candidates |= arrays.exit_signal[start:end]
+            if strategy.trailing_stop:
+                candidates |= self._trailing_candidates(high, breakeven, trade.stop_loss)
+            pos = int(candidates.argmax())
+            if candidates[pos]:
+                return start + pos
+            start = end
+            chunk = min(chunk * 4, SEARCH_CHUNK_MAX)
+        return count
+
+    def _trailing_candidates(
+        self, high: np.ndarray, breakeven: float, stop_loss: float
+    ) -> np.ndarray:
+        """
+        Candles which may raise the trailing stoploss (see IStrategy.ft_stoploss_adjust()).
+        """
+        strategy = self._strategy
+        profit = high / breakeven - 1
+        offset = strategy.trailing_stop_positive_offset
+        stoploss = abs(strategy.stoploss)
+        if strategy.trailing_stop_positive is not None:
+            positive = abs(strategy.trailing_stop_positive)
+            # Use the closer stoploss if the profit is too close to the offset to decide
+            stoploss_value = np.where(
+                profit > offset + PROFIT_EPS,
+                positive,
+                np.where(profit < offset - PROFIT_EPS, stoploss, min(stoploss, positive)),
+            )
+        else:
+            stoploss_value = np.full(len(high), stoploss)
+        candidates = high * (1 - stoploss_value) > stop_loss * (1 - PRICE_EPS)
+        if strategy.trailing_only_offset_is_reached:
+            candidates &= profit >= offset - PROFIT_EPS
+        return candidates
+
+    def _next_entry(self, arrays: PairArrays, start: int) -> int:
+        idx = int(np.searchsorted(arrays.entry_rows, start))
+        return int(arrays.entry_rows[idx]) if idx < len(arrays.entry_rows) else len(arrays.dates)
+
+    def _next_event(self, pair: str, start: int) -> int:
+        arrays = self._pairs[pair]
+        if trades := LocalTrade.bt_trades_open_pp[pair]:
+            return self._find_exit_candidate(arrays, trades[0], start)
+        return self._next_entry(arrays, start)
+
+    def _update_min_max_rates(self, pair: str, start: int, end: int) -> None:
+        """
+        Update max / min rate of the pair's open trade with the skipped candles start to end.
+        """
+        trades = LocalTrade.bt_trades_open_pp[pair]
+        if start < end and trades and trades[0].has_open_position:
+            arrays = self._pairs[pair]
+            trades[0].adjust_min_max_rates(
+                float(arrays.high[start:end].max()), float(arrays.low[start:end].min())
+            )
+
+    def run(self, backtesting: "Backtesting", start_date: datetime, end_date: datetime) -> None:
+        """
+        Run the backtest loop. Equivalent to the loop in Backtesting.backtest().
+        """
+        self._strategy = backtesting.strategy
+        roi_minutes = sorted(self._strategy.minimal_roi.keys())
+        self._roi_minutes = np.array(roi_minutes, dtype=float)
+        self._roi_values = np.array(
+            [self._strategy.minimal_roi[key] for key in roi_minutes], dtype=float
+        )
+        pair_order = {pair: idx for idx, pair in enumerate(self._pair_list)}
+        # Row index of the first candle not yet processed, per pair
+        processed: dict[str, int] = dict.fromkeys(self._pairs, 0)
+        # Events as (candle index, pair)
+        events: list[tuple[int, str]] = []
+
+        def push_event(pair: str, row_index: int) -> None:
+            arrays = self._pairs[pair]
+            row_index = self._next_event(pair, row_index)
+            if row_index < len(arrays.dates):
+                heapq.heappush(events, (arrays.offset + row_index, pair))
+
+        for pair in self._pairs:
+            push_event(pair, 0)
+
+        while events:
+            candle = events[0][0]
+            pairs = []
+            while events and events[0][0] == candle:
+                pairs.append(heapq.heappop(events)[1])
+            current_time = start_date + backtesting.timeframe_td * (candle + 1)
+            backtesting.check_abort(current_time)
+            backtesting.dataprovider._set_dataframe_max_date(current_time)
+            for pair, arrays in self._pairs.items():
+                if candle >= arrays.offset:
+                    backtesting.dataprovider._set_dataframe_max_index(
+                        pair,
+                        backtesting.required_startup
+                        + min(candle - arrays.offset + 1, len(arrays.dates)),
+                    )
+            # Pairs with open trades are processed first, like in time_pair_generator()
+            open_trade_order = {
+                trade.pair: idx for idx, trade in enumerate(LocalTrade.bt_trades_open)
+            }
+            pairs.sort(
+                key=lambda p: (0, open_trade_order[p])
+                if p in open_trade_order
+                else (1, pair_order[p])
+            )
+            for pair in pairs:
+                row_index = candle - self._pairs[pair].offset
+                self._update_min_max_rates(pair, processed[pair], row_index)
+                row = self._pairs[pair].rows[row_index]
+                backtesting.backtest_loop(
+                    row,
+                    pair,
+                    current_time,
+                    backtesting.check_for_trade_entry(row),
+                    current_time != end_date,
+                )
+                processed[pair] = row_index + 1
+                push_event(pair, row_index + 1)
+
+        for pair, arrays in self._pairs.items():
+            self._update_min_max_rates(pair, processed[pair], len(arrays.dates))
+        # Checkpoints after the last event
+        backtesting.check_abort(end_date)
@@ -46,19 +46,35 @@ class PairLock(ModelBase):
         :param pair: Pair to check for. Returns all current locks if pair is empty
         :param now: Datetime object (generated via datetime.now(timezone.utc)).
         """
+        filters = PairLock._lock_filters(now, side)
+        if pair:
+            filters.append(PairLock.pair == pair)
+
+        return PairLock.session.scalars(select(PairLock).filter(*filters))
+
+    @staticmethod
+    def has_pair_locks(pairs: list[str], now: datetime, side: str | None = None) -> bool:
+        """
+        Check if any of the pairs has an active lock, without loading the locks.
+        :param pairs: Pairs to check for
+        :param now: Datetime object (generated via datetime.now(timezone.utc)).
+        """
+        filters = PairLock._lock_filters(now, side)
+        filters.append(PairLock.pair.in_(pairs))
+        return PairLock.session.scalar(select(PairLock.id).filter(*filters).limit(1)) is not None
+
+    @staticmethod
+    def _lock_filters(now: datetime, side: str | None) -> list:
         filters = [
             PairLock.lock_end_time > now,
             # Only active locks
             PairLock.active.is_(True),
         ]
-        if pair:
-            filters.append(PairLock.pair == pair)
         if side is not None and side != "*":
             filters.append(or_(PairLock.side == side, PairLock.side == "*"))
         elif side is not None:
             filters.append(PairLock.side == "*")
-
-        return PairLock.session.scalars(select(PairLock).filter(*filters))
+        return filters
 
     @staticmethod
     def get_all_locks() -> ScalarResult["PairLock"]:
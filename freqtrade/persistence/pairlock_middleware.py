@@ -1,6 +1,8 @@
 import logging
+from bisect import bisect_left, insort
 from collections.abc import Sequence
 from datetime import UTC, datetime
+from operator import attrgetter
 
 from sqlalchemy import select
 
@@ -20,6 +22,11 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # Index on PairLocks.locks (non-DB mode) - per pair, with None for all pairs.
+    # Every list is sorted by lock_end_time, so expired locks are skipped via bisection.
+    _lock_index: dict[str | None, list[PairLock]] = {}
+    _indexed_locks: list[PairLock] | None = None
+    _indexed_count = 0
 
     timeframe: str = ""
 
@@ -30,6 +37,52 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._rebuild_index()
+
+    @staticmethod
+    def _rebuild_index() -> None:
+        PairLocks._lock_index = {}
+        for lock in PairLocks.locks:
+            PairLocks._index_lock(lock)
+        PairLocks._indexed_locks = PairLocks.locks
+        PairLocks._indexed_count = len(PairLocks.locks)
+
+    @staticmethod
+    def _index_lock(lock: PairLock) -> None:
+        if not lock.active:
+            return
+        for key in (lock.pair, None):
+            index = PairLocks._lock_index.setdefault(key, [])
+            if not index or index[-1].lock_end_time <= lock.lock_end_time:
+                # Locks are usually created with increasing end times
+                index.append(lock)
+            else:
+                insort(index, lock, key=attrgetter("lock_end_time"))
+
+    @staticmethod
+    def _get_indexed_locks(pair: str | None, now: datetime) -> list[PairLock]:
+        """
+        Get locks for this pair (all pairs if pair is None) which didn't end before now.
+        Rebuilds the index if PairLocks.locks has been replaced or modified directly.
+        """
+        if PairLocks._indexed_locks is not PairLocks.locks or PairLocks._indexed_count != len(
+            PairLocks.locks
+        ):
+            PairLocks._rebuild_index()
+        index = PairLocks._lock_index.get(pair)
+        if not index:
+            return []
+        return index[bisect_left(index, now, key=attrgetter("lock_end_time")) :]
+
+    @staticmethod
+    def _unindex_lock(lock: PairLock) -> None:
+        """
+        Remove a released lock from the index - it can't become active again.
+        """
+        for key in (lock.pair, None):
+            index = PairLocks._lock_index.get(key, [])
+            if lock in index:
+                index.remove(lock)
 
     @staticmethod
     def lock_pair(
@@ -62,6 +115,9 @@ class PairLocks:
             PairLock.session.add(lock)
             PairLock.session.commit()
         else:
+            if PairLocks._indexed_locks is PairLocks.locks:
+                PairLocks._index_lock(lock)
+                PairLocks._indexed_count += 1
             PairLocks.locks.append(lock)
         return lock
 
@@ -84,13 +140,8 @@ class PairLocks:
         else:
             locks = [
                 lock
-                for lock in PairLocks.locks
-                if (
-                    lock.lock_end_time >= now
-                    and lock.active is True
-                    and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
-                )
+                for lock in PairLocks._get_indexed_locks(pair, now)
+                if (lock.active is True and (side is None or lock.side == "*" or lock.side == side))
             ]
             return locks
 
@@ -122,6 +173,9 @@ class PairLocks:
             lock.active = False
         if PairLocks.use_db:
             PairLock.session.commit()
+        else:
+            for lock in locks:
+                PairLocks._unindex_lock(lock)
 
     @staticmethod
     def unlock_reason(reason: str, now: datetime | None = None) -> None:
@@ -153,6 +207,7 @@ class PairLocks:
             for lock in locksb:
                 if lock.reason == reason:
                     lock.active = False
+                    PairLocks._unindex_lock(lock)
 
     @staticmethod
     def is_global_lock(now: datetime | None = None, side: str = "*") -> bool:
@@ -175,6 +230,9 @@ class PairLocks:
         if not now:
             now = datetime.now(UTC)
 
+        if PairLocks.use_db:
+            # Single query for both pair and global locks
+            return PairLock.has_pair_locks([pair, "*"], now, side)
         return len(PairLocks.get_pair_locks(pair, now, side)) > 0 or PairLocks.is_global_lock(
             now, side
         )
@@ -0,0 +1,189 @@
+"""
+Append-only, columnar storage for closed backtest trades.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from freqtrade.util import dt_from_ts, dt_ts
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+
+class LedgerTrade:
+    """
+    Read-only view on a closed trade stored in the TradeLedger.
+    Provides the attributes of the trade's (minified) json representation,
+    as well as the most commonly used LocalTrade attributes.
+    """
+
+    __slots__ = ("_row", "orders")
+
+    is_open = False
+    # Closed trades can't have open orders
+    open_orders: list = []
+
+    def __init__(self, row: dict[str, Any], orders: list[dict[str, Any]]) -> None:
+        self._row = row
+        self.orders = orders
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._row[name]
+        except KeyError:
+            raise AttributeError(f"'LedgerTrade' object has no attribute '{name}'") from None
+
+    def __repr__(self) -> str:
+        return (
+            f"LedgerTrade(id={self.id}, pair={self.pair}, amount={self.amount:.8f}, "
+            f"is_short={self.is_short}, open_rate={self.open_rate:.8f}, "
+            f"close_date={self.close_date})"
+        )
+
+    @property
+    def id(self) -> int:
+        return self._row["trade_id"]
+
+    @property
+    def open_date(self) -> datetime:
+        return dt_from_ts(self._row["open_timestamp"])
+
+    @property
+    def close_date(self) -> datetime:
+        return dt_from_ts(self._row["close_timestamp"])
+
+    open_date_utc = open_date
+    close_date_utc = close_date
+
+    @property
+    def trade_direction(self) -> str:
+        return "short" if self._row["is_short"] else "long"
+
+    @property
+    def nr_of_successful_entries(self) -> int:
+        return len([o for o in self.orders if o["ft_is_entry"]])
+
+    @property
+    def nr_of_successful_exits(self) -> int:
+        return len([o for o in self.orders if not o["ft_is_entry"]])
+
+    def to_json(self, minified: bool = False) -> dict[str, Any]:
+        return {**self._row, "orders": self.orders}
+
+
+class TradeLedger:
+    """
+    Stores closed backtest trades column-wise (one list per field of ``LocalTrade.to_json()``),
+    with orders kept in a separate side table.
+    Closed trades are no longer needed as objects - so they're flushed into the ledger,
+    avoiding the memory and GC overhead of keeping all trade and order objects alive.
+    """
+
+    def __init__(self) -> None:
+        self._columns: dict[str, list] = {}
+        self._order_columns: dict[str, list] = {}
+        # Start index of every trade's orders within the order side table (plus the end)
+        self._order_offsets: list[int] = [0]
+        self._open_ts = array("q")
+        self._close_ts = array("q")
+        # Close timestamps are usually appended in ascending order, allowing bisection.
+        self._close_sorted = True
+        self._pair_index: dict[str, list[int]] = {}
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> LedgerTrade:
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError("TradeLedger index out of range")
+        row = {key: col[idx] for key, col in self._columns.items()}
+        return LedgerTrade(row, self._get_orders(idx))
+
+    def __iter__(self) -> Iterator[LedgerTrade]:
+        return (self[idx] for idx in range(self._len))
+
+    def _get_orders(self, idx: int) -> list[dict[str, Any]]:
+        start, end = self._order_offsets[idx], self._order_offsets[idx + 1]
+        return [
+            {key: col[i] for key, col in self._order_columns.items()} for i in range(start, end)
+        ]
+
+    @staticmethod
+    def _append_row(columns: dict[str, list], row: dict[str, Any], length: int) -> None:
+        new_key = False
+        for key, value in row.items():
+            if key not in columns:
+                columns[key] = [None] * length
+                new_key = True
+            columns[key].append(value)
+        if new_key or len(row) != len(columns):
+            # Keep columns aligned if a field is missing in this row
+            for col in columns.values():
+                if len(col) == length:
+                    col.append(None)
+
+    def append(self, trade: "LocalTrade") -> None:
+        """
+        Flush a closed trade into the ledger.
+        """
+        row = trade.to_json(True)
+        orders = row.pop("orders")
+        order_count = self._order_offsets[-1]
+        for order in orders:
+            self._append_row(self._order_columns, order, order_count)
+            order_count += 1
+        self._order_offsets.append(order_count)
+        self._append_row(self._columns, row, self._len)
+
+        close_ts = row["close_timestamp"]
+        if self._close_ts and close_ts < self._close_ts[-1]:
+            self._close_sorted = False
+        self._open_ts.append(row["open_timestamp"])
+        self._close_ts.append(close_ts)
+        self._pair_index.setdefault(row["pair"], []).append(self._len)
+        self._len += 1
+
+    def select(
+        self,
+        *,
+        pair: str | None = None,
+        open_date: datetime | None = None,
+        close_date: datetime | None = None,
+    ) -> list[LedgerTrade]:
+        """
+        Query trades - filters behave like ``LocalTrade.get_trades_proxy()``.
+        :param pair: Filter by pair
+        :param open_date: Filter by open_date (filters via trade.open_date > input)
+        :param close_date: Filter by close_date (filters via trade.close_date > input)
+        """
+        idxs: list[int] | range = self._pair_index.get(pair, []) if pair else range(self._len)
+        if close_date:
+            close_ts = dt_ts(close_date)
+            if self._close_sorted:
+                start = bisect_right(idxs, close_ts, key=self._close_ts.__getitem__)
+                idxs = idxs[start:]
+            else:
+                idxs = [i for i in idxs if self._close_ts[i] > close_ts]
+        if open_date:
+            open_ts = dt_ts(open_date)
+            idxs = [i for i in idxs if self._open_ts[i] > open_ts]
+        return [self[i] for i in idxs]
+
+    def column(self, name: str) -> list:
+        """
+        Values of one field for all trades.
+        Orders are returned as list of order dicts per trade.
+        """
+        if name == "orders":
+            return [self._get_orders(idx) for idx in range(self._len)]
+        return self._columns.get(name, [None] * self._len)
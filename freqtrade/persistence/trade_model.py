@@ -48,6 +48,7 @@ from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
+from freqtrade.persistence.trade_ledger import TradeLedger
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
 
@@ -385,8 +386,9 @@ class LocalTrade:
     """
 
     use_db: bool = False
-    # Trades container for backtesting
-    bt_trades: list["LocalTrade"] = []
+    # Trades container for backtesting.
+    # Backtesting stores closed trades column-wise in a TradeLedger.
+    bt_trades: list["LocalTrade"] | TradeLedger = []
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
@@ -760,11 +762,13 @@ class LocalTrade:
         }
 
     @staticmethod
-    def reset_trades() -> None:
+    def reset_trades(use_ledger: bool = False) -> None:
         """
         Resets all trades. Only active for backtesting mode.
+        :param use_ledger: Flush closed trades into a TradeLedger instead of keeping
+            the trade objects. Closed trades are then returned as read-only views.
         """
-        LocalTrade.bt_trades = []
+        LocalTrade.bt_trades = TradeLedger() if use_ledger else []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
@@ -1445,6 +1449,7 @@ class LocalTrade:
         Returns a List of trades, filtered on the parameters given.
         In live mode, converts the filter to a database query and returns all rows
         In Backtest mode, uses filters on Trade.bt_trades to get the result.
+        Closed trades stored in a TradeLedger are returned as read-only LedgerTrade objects.
 
         :param pair: Filter by pair
         :param is_open: Filter by open/closed status
@@ -1458,12 +1463,20 @@ class LocalTrade:
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
+            elif isinstance(LocalTrade.bt_trades, TradeLedger):
+                # LedgerTrade provides the attributes of closed trades used by protections
+                return cast(
+                    list[LocalTrade],
+                    LocalTrade.bt_trades.select(
+                        pair=pair, open_date=open_date, close_date=close_date
+                    ),
+                )
             else:
                 sel_trades = LocalTrade.bt_trades
 
         else:
             # Not used during backtesting, but might be used by a strategy
-            sel_trades = list(LocalTrade.bt_trades + LocalTrade.bt_trades_open)
+            sel_trades = [*LocalTrade.bt_trades, *LocalTrade.bt_trades_open]
 
         if pair:
             sel_trades = [trade for trade in sel_trades if trade.pair == pair]
@@ -126,6 +126,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Count of candles the strategy requires before producing valid signals
     startup_candle_count: int = 0
 
+    # Strategy results only depend on the last startup_candle_count candles and on
+    # trade state (no state kept in the strategy object). Required for incremental backtests.
+    deterministic_backtest: bool = False
+
     # Protections
     protections: list = []
 
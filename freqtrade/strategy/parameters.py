@@ -5,8 +5,8 @@ This module defines a base class for auto-hyperoptable strategies.
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
 from typing import Any, Union
 
 from freqtrade.enums import HyperoptState
@@ -26,6 +26,27 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Parameters read while tracing is active - see trace_parameter_access()
+_accessed_parameters: set["BaseParameter"] | None = None
+
+
+@contextmanager
+def trace_parameter_access() -> Iterator[set["BaseParameter"]]:
+    """
+    Collect all parameters whose value is read within this context.
+    Used by hyperopt to determine which parameters populated indicators depend on.
+    """
+    global _accessed_parameters
+    previous = _accessed_parameters
+    accessed: set[BaseParameter] = set()
+    _accessed_parameters = accessed
+    try:
+        yield accessed
+    finally:
+        _accessed_parameters = previous
+        if previous is not None:
+            previous.update(accessed)
+
 
 class BaseParameter(ABC):
     """
@@ -34,7 +55,6 @@ class BaseParameter(ABC):
 
     category: str | None
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -70,6 +90,16 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        if _accessed_parameters is not None:
+            _accessed_parameters.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Any):
+        self._value = new_value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
@@ -260,7 +290,7 @@ class DecimalParameter(NumericParameter):
 
     @property
     def value(self) -> float:
-        return self._value
+        return super().value
 
     @value.setter
     def value(self, new_value: float):
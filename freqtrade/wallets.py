@@ -3,6 +3,7 @@
 
 import logging
 from datetime import datetime, timedelta
+from math import isclose
 from typing import Literal, NamedTuple
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
@@ -148,18 +149,7 @@ class Wallets:
 
             used_stake = tot_in_trades
 
-        cross_margin = 0.0
-        if self._config.get("margin_mode") == "cross":
-            # In cross-margin mode, the total balance is used as collateral.
-            # This is moved as "free" into the stake currency balance.
-            # strongly tied to the get_collateral() implementation.
-            for curr, bal in self._start_cap.items():
-                if curr == self._stake_currency:
-                    continue
-                rate = self._exchange.get_conversion_rate(curr, self._stake_currency)
-                if rate:
-                    cross_margin += bal * rate
-
+        cross_margin = self._get_cross_margin()
         current_stake = self._start_cap.get(self._stake_currency, 0) + tot_profit - tot_in_trades
         total_stake = current_stake + used_stake
 
@@ -176,6 +166,22 @@ class Wallets:
         self._wallets = _wallets
         self._positions = _positions
 
+    def _get_cross_margin(self) -> float:
+        """
+        In cross-margin mode, the total balance is used as collateral.
+        This is moved as "free" into the stake currency balance.
+        strongly tied to the get_collateral() implementation.
+        """
+        cross_margin = 0.0
+        if self._config.get("margin_mode") == "cross":
+            for curr, bal in self._start_cap.items():
+                if curr == self._stake_currency:
+                    continue
+                rate = self._exchange.get_conversion_rate(curr, self._stake_currency)
+                if rate:
+                    cross_margin += bal * rate
+        return cross_margin
+
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
         _wallets = {}
@@ -436,3 +442,173 @@ class Wallets:
                 logger.debug(msg)
             else:
                 logger.info(msg)
+
+
+class BacktestWallets(Wallets):
+    """
+    Wallets used during backtesting.
+    Keeps running aggregates of realized profit and stake of all open trades, which are updated
+    with the delta of the pairs processed since the last update - instead of recalculating
+    all open trades on every update.
+    With debug logging enabled, every incremental update is cross-checked against the
+    full recalculation.
+    """
+
+    def __init__(self, config: Config, exchange: Exchange) -> None:
+        self._verify = logger.isEnabledFor(logging.DEBUG)
+        self._active_pair: str | None = None
+        self._dirty_pairs: set[str] = set()
+        self._reset_aggregates()
+        super().__init__(config, exchange, is_backtest=True)
+
+    def _reset_aggregates(self) -> None:
+        # pair -> (realized_profit, stake_amount, used_stake) of the pair's open trades
+        self._pair_stakes: dict[str, tuple[float, float, float]] = {}
+        # currency -> pair -> (trade id, wallet) of the pair's last open trade (spot only)
+        self._currency_wallets: dict[str, dict[str, tuple[int, Wallet]]] = {}
+        self._realized_profit = 0.0
+        self._stake_in_trades = 0.0
+        self._used_stake = 0.0
+        self._cross_margin = 0.0
+
+    def set_active_pair(self, pair: str) -> None:
+        """
+        Set the pair the backtest is currently processing.
+        Only trades of active (or previously active) pairs can change, so only these
+        are refreshed by update_incremental().
+        """
+        if pair != self._active_pair:
+            if self._active_pair is not None:
+                self._dirty_pairs.add(self._active_pair)
+            self._active_pair = pair
+
+    def update(self, require_update: bool = True) -> None:
+        """
+        Full recalculation of all balances, resetting the running aggregates.
+        """
+        super().update(require_update)
+        self._reset_aggregates()
+        self._cross_margin = self._get_cross_margin()
+        for pair in list(LocalTrade.bt_trades_open_pp):
+            self._refresh_pair(pair)
+        self._dirty_pairs.clear()
+
+    def update_incremental(self, pair: str) -> None:
+        """
+        Update balances after a trade or order event.
+        :param pair: Pair of the trade the event belongs to
+        """
+        self._dirty_pairs.add(pair)
+        if self._active_pair is not None:
+            self._dirty_pairs.add(self._active_pair)
+        for pair in self._dirty_pairs:
+            self._refresh_pair(pair)
+        self._dirty_pairs.clear()
+        if not self._pair_stakes:
+            # Avoid accumulating float errors while there are no open trades
+            self._realized_profit = self._stake_in_trades = self._used_stake = 0.0
+
+        current_stake = (
+            self._start_cap.get(self._stake_currency, 0)
+            + LocalTrade.bt_total_profit
+            + self._realized_profit
+            - self._stake_in_trades
+        )
+        self._wallets[self._stake_currency] = Wallet(
+            currency=self._stake_currency,
+            free=current_stake + self._cross_margin,
+            used=self._used_stake,
+            total=current_stake + self._used_stake,
+        )
+        if self._verify:
+            self._verify_aggregates()
+
+    def _refresh_pair(self, pair: str) -> None:
+        """
+        Replace the pair's contribution to the running aggregates.
+        Mirrors the per-trade calculation of Wallets._update_dry().
+        """
+        realized_profit, stake_amount, used_stake = self._pair_stakes.pop(pair, (0.0, 0.0, 0.0))
+        self._realized_profit -= realized_profit
+        self._stake_in_trades -= stake_amount
+        self._used_stake -= used_stake
+
+        trades = LocalTrade.bt_trades_open_pp.get(pair)
+        is_futures = self._config.get("trading_mode", "spot") == TradingMode.FUTURES
+        curr = pair if is_futures else self._exchange.get_pair_base_currency(pair)
+        if not trades:
+            if is_futures:
+                self._positions.pop(pair, None)
+                return
+            currency_wallets = self._currency_wallets.get(curr, {})
+            currency_wallets.pop(pair, None)
+            if currency_wallets:
+                # Other pairs with the same base currency have open trades
+                self._wallets[curr] = max(currency_wallets.values())[1]
+            elif curr in self._start_cap:
+                bal = self._start_cap[curr]
+                self._wallets[curr] = Wallet(curr, bal, 0, bal)
+            else:
+                self._wallets.pop(curr, None)
+            return
+
+        realized_profit = stake_amount = used_stake = 0.0
+        for trade in trades:
+            realized_profit += trade.realized_profit
+            stake_amount += trade.stake_amount
+            if is_futures:
+                used_stake += trade.stake_amount
+                self._positions[pair] = PositionWallet(
+                    pair,
+                    position=trade.amount,
+                    leverage=trade.leverage,
+                    collateral=trade.stake_amount,
+                    side=trade.trade_direction,
+                )
+            else:
+                open_orders = trade.open_orders
+                used_stake += sum(
+                    o.stake_amount for o in open_orders if o.ft_order_side == trade.entry_side
+                )
+                pending = sum(
+                    o.amount for o in open_orders if o.amount and o.ft_order_side == trade.exit_side
+                )
+                curr_wallet_bal = self._start_cap.get(curr, 0)
+                wallet = Wallet(
+                    curr,
+                    curr_wallet_bal + trade.amount - pending,
+                    pending,
+                    trade.amount + curr_wallet_bal,
+                )
+                currency_wallets = self._currency_wallets.setdefault(curr, {})
+                currency_wallets[pair] = (trade.id, wallet)
+                # The most recent trade of the currency wins - like in _update_dry()
+                self._wallets[curr] = max(currency_wallets.values())[1]
+        self._pair_stakes[pair] = (realized_profit, stake_amount, used_stake)
+        self._realized_profit += realized_profit
+        self._stake_in_trades += stake_amount
+        self._used_stake += used_stake
+
+    def _verify_aggregates(self) -> None:
+        """
+        Cross-check the incrementally updated balances against the full recalculation.
+        """
+        wallets, positions = self._wallets, self._positions
+        self.update()
+        mismatches = [
+            f"{key}: {incr} != {full}"
+            for key, incr, full in (
+                *((c, wallets.get(c), w) for c, w in self._wallets.items()),
+                *((p, positions.get(p), pos) for p, pos in self._positions.items()),
+            )
+            if incr is None
+            or any(
+                not isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+                for a, b in zip(incr[1:], full[1:], strict=True)
+                if isinstance(a, float | int) and isinstance(b, float | int)
+            )
+        ]
+        if len(wallets) != len(self._wallets) or len(positions) != len(self._positions):
+            mismatches.append(f"{list(wallets)} != {list(self._wallets)}")
+        if mismatches:
+            logger.warning(f"Backtest wallet aggregates differ from recalculation: {mismatches}")
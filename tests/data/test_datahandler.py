@@ -5,9 +5,13 @@ from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pyarrow as pa
+import pyarrow.feather as pa_feather
+import pyarrow.parquet as pq
 import pytest
 from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
+from pyarrow import dataset
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
@@ -391,11 +395,7 @@ def test_generic_datahandler_ohlcv_load_and_resave(
 
     # Try loading a file that exists but errors
     mocker.patch(
-        "freqtrade.data.history.datahandlers.featherdatahandler.read_feather",
-        side_effect=Exception("Test"),
-    )
-    mocker.patch(
-        "freqtrade.data.history.datahandlers.parquetdatahandler.read_parquet",
+        "freqtrade.data.history.datahandlers.idatahandler.dataset.dataset",
         side_effect=Exception("Test"),
     )
     ohlcv_e = dh1.ohlcv_load("UNITTEST/NEW", timeframe, candle_type=candle_type)
@@ -403,6 +403,69 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize("int_dates", [False, True])
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_generic_datahandler_ohlcv_load_timerange(
+    datahandler, int_dates, mocker, testdatadir, tmp_path
+):
+    mocker.patch("freqtrade.data.history.datahandlers.parquetdatahandler.OHLCV_ROW_GROUP_SIZE", 500)
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load("UNITTEST/BTC", "5m", None, "spot")
+    dh = get_datahandler(tmp_path, datahandler)
+    if int_dates:
+        # Dates stored as timestamps in milliseconds
+        stored = ohlcv.assign(date=ohlcv["date"].astype("int64") // 10**6)
+        table = pa.Table.from_pandas(stored, preserve_index=False)
+        filename = tmp_path / f"UNITTEST_BTC-5m.{dh._get_file_extension()}"
+        if datahandler == "feather":
+            pa_feather.write_feather(table, filename)
+        else:
+            pq.write_table(table, filename, row_group_size=500)
+    else:
+        dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)
+    expected = ohlcv[(ohlcv["date"] >= timerange.startdt) & (ohlcv["date"] <= timerange.stopdt)]
+    assert 0 < len(loaded) < len(ohlcv)
+    assert_frame_equal(loaded, expected.reset_index(drop=True))
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT), ohlcv)
+
+    # Open end
+    timerange = TimeRange("date", None, timerange.startts, 0)
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv[ohlcv["date"] >= timerange.startdt].reset_index(drop=True))
+
+    if datahandler == "parquet":
+        # Row groups outside of the timerange are skipped based on their statistics
+        pairdataset = dataset.dataset(
+            dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "5m", CandleType.SPOT)
+        )
+        fragment = next(pairdataset.get_fragments())
+        time_filter = IDataHandler._build_arrow_date_filter(
+            pairdataset.schema.field(0), TimeRange.parse_timerange("20180115-20180116")
+        )
+        assert fragment.num_row_groups > 2
+        assert len(fragment.split_by_row_group(time_filter)) < fragment.num_row_groups
+
+
+def test_datahandler_ohlcv_load_drop_incomplete(testdatadir):
+    dh = get_datahandler(testdatadir, "feather")
+    full = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, drop_incomplete=False)
+    stop = full.iloc[-10]["date"]
+    timerange = TimeRange("date", "date", 0, int(stop.timestamp()))
+    timerange.startts = int(full.iloc[100]["date"].timestamp())
+    # The last loaded candle is not the last candle in the file - and therefore complete.
+    ohlcv = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange)
+    assert ohlcv.iloc[-1]["date"] == stop
+    ohlcv = dh.ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange, drop_incomplete=True
+    )
+    assert ohlcv.iloc[-1]["date"] == stop
+    # Without a timerange, the last candle is dropped
+    ohlcv = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, drop_incomplete=True)
+    assert ohlcv.iloc[-1]["date"] == full.iloc[-2]["date"]
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -0,0 +1,180 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103, unused-argument
+
+import pickle
+
+import pandas as pd
+
+from freqtrade.configuration import TimeRange
+from freqtrade.optimize.backtest_snapshot import (
+    BACKTEST_SNAPSHOT_VERSION,
+    dump_snapshot_state,
+    get_backtest_snapshot_filename,
+    load_backtest_snapshot,
+    load_snapshot_state,
+    store_backtest_snapshot,
+)
+from freqtrade.optimize.backtesting import Backtesting
+from tests.conftest import log_has, log_has_re, patch_exchange
+
+
+def _signals_by_date(dataframe, metadata=None):
+    # Signals only depend on the candle itself - so the strategy is deterministic
+    minute = dataframe["date"].dt.minute
+    dataframe["enter_long"] = ((minute == 0) & (dataframe["date"].dt.hour % 4 == 0)).astype(int)
+    dataframe["exit_long"] = (minute == 30).astype(int) & (dataframe["date"].dt.hour % 8 == 2)
+    dataframe["enter_short"] = 0
+    dataframe["exit_short"] = 0
+    return dataframe
+
+
+def _run_backtest(conf, timerange: str, incremental: bool = True):
+    conf["timerange"] = timerange
+    conf["backtest_incremental"] = incremental
+    backtesting = Backtesting(conf)
+    strategy = backtesting.strategylist[0]
+    strategy.deterministic_backtest = True
+    strategy.advise_entry = _signals_by_date
+    strategy.advise_exit = _signals_by_date
+    data, tr = backtesting.load_bt_data()
+    min_date, max_date = backtesting.backtest_one_strategy(strategy, data, tr)
+    results = backtesting.all_bt_content[strategy.get_strategy_name()]
+    return backtesting, results, min_date, max_date
+
+
+def _read_snapshot(filename):
+    with filename.open("rb") as fp:
+        return pickle.load(fp)  # noqa: S301
+
+
+def _setup(default_conf, tmp_path, mocker):
+    patch_exchange(mocker)
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["pairs"] = ["ETH/BTC", "LTC/BTC"]
+    default_conf["exchange"]["pair_whitelist"] = ["ETH/BTC", "LTC/BTC"]
+    default_conf["max_open_trades"] = 2
+    default_conf["stake_amount"] = 0.01
+    default_conf["minimal_roi"] = {"0": 10}
+    default_conf["stoploss"] = -0.05
+    default_conf["enable_protections"] = True
+    default_conf["protections"] = [{"method": "CooldownPeriod", "stop_duration_candles": 3}]
+    mocker.patch(
+        "freqtrade.optimize.backtesting.Backtesting._get_min_cached_backtest_date",
+        return_value=None,
+    )
+
+
+def test_backtest_incremental(default_conf, tmp_path, mocker, caplog):
+    _setup(default_conf, tmp_path, mocker)
+    _, full, full_min, full_max = _run_backtest(default_conf, "20180110-20180120", False)
+    assert not (tmp_path / "cache").exists()
+
+    _, first, _, first_max = _run_backtest(default_conf, "20180110-20180115")
+    filename = get_backtest_snapshot_filename(default_conf, "StrategyTestV3")
+    assert filename.is_file()
+    first_snapshot = _read_snapshot(filename)
+    assert first_snapshot["start_date"] == full_min
+    assert log_has_re(r"Stored backtest snapshot at .*", caplog)
+    assert len(first["results"]) < len(full["results"])
+
+    caplog.clear()
+    _, incr, incr_min, incr_max = _run_backtest(default_conf, "20180110-20180120")
+    assert log_has_re(r"Continuing backtest from snapshot at .*", caplog)
+    assert incr_min == full_min
+    assert incr_max == full_max
+    assert first_max < incr_max
+    cols = ["pair", "open_date", "close_date", "open_rate", "close_rate", "exit_reason"]
+    pd.testing.assert_frame_equal(
+        incr["results"][cols].reset_index(drop=True), full["results"][cols].reset_index(drop=True)
+    )
+    assert incr["final_balance"] == full["final_balance"]
+
+    # Snapshot has been replaced
+    snapshot = _read_snapshot(filename)
+    assert snapshot["snapshot_date"] > first_snapshot["snapshot_date"]
+    assert snapshot["start_date"] == full_min
+
+
+def test_backtest_incremental_fallback(default_conf, tmp_path, mocker, caplog):
+    _setup(default_conf, tmp_path, mocker)
+    _run_backtest(default_conf, "20180110-20180115")
+    filename = get_backtest_snapshot_filename(default_conf, "StrategyTestV3")
+
+    # Changed data
+    snapshot = _read_snapshot(filename)
+    store_backtest_snapshot(filename, {**snapshot, "last_close": {"ETH/BTC": 0.1}})
+    caplog.clear()
+    _run_backtest(default_conf, "20180110-20180120")
+    assert log_has(
+        "Data for ETH/BTC changed since the backtest snapshot, running a full backtest.",
+        caplog,
+    )
+    assert not log_has_re(r"Continuing backtest from snapshot at .*", caplog)
+
+    # Wallet can't be restored from the snapshot trades
+    _run_backtest(default_conf, "20180110-20180115")
+    snapshot = _read_snapshot(filename)
+    state = load_snapshot_state(snapshot)
+    state["wallet_total"] += 0.5
+    store_backtest_snapshot(filename, {**snapshot, "state": dump_snapshot_state(state)})
+    caplog.clear()
+    _run_backtest(default_conf, "20180110-20180120")
+    assert log_has(
+        "Wallet balance does not match the backtest snapshot, running a full backtest.", caplog
+    )
+    assert not log_has_re(r"Continuing backtest from snapshot at .*", caplog)
+
+    # Different backtest start
+    caplog.clear()
+    _run_backtest(default_conf, "20180111-20180120")
+    assert log_has(
+        "Backtest start changed or no new candles available since the backtest snapshot, "
+        "running a full backtest.",
+        caplog,
+    )
+
+    # Changed config
+    caplog.clear()
+    default_conf["stake_amount"] = 0.02
+    _run_backtest(default_conf, "20180111-20180121")
+    assert log_has(
+        "Strategy or configuration changed since the backtest snapshot, ignoring.", caplog
+    )
+    assert not log_has_re(r"Continuing backtest from snapshot at .*", caplog)
+
+
+def test_backtest_incremental_not_deterministic(default_conf, tmp_path, mocker, caplog):
+    _setup(default_conf, tmp_path, mocker)
+    default_conf["timerange"] = "20180110-20180115"
+    default_conf["backtest_incremental"] = True
+    backtesting = Backtesting(default_conf)
+    data, tr = backtesting.load_bt_data()
+    backtesting.backtest_one_strategy(backtesting.strategylist[0], data, tr)
+    assert log_has(
+        "Strategy does not set `deterministic_backtest`, running a full backtest.", caplog
+    )
+    assert not get_backtest_snapshot_filename(default_conf, "StrategyTestV3").exists()
+
+
+def test_load_backtest_snapshot(tmp_path, caplog):
+    filename = tmp_path / "snapshot.pkl"
+    assert load_backtest_snapshot(filename, "abc") is None
+    snapshot = {
+        "version": BACKTEST_SNAPSHOT_VERSION,
+        "run_id": "abc",
+        "start_date": TimeRange.parse_timerange("20180110-").startdt,
+        "snapshot_date": TimeRange.parse_timerange("20180111-").startdt,
+        "indexes": {"ETH/BTC": 10},
+        "last_close": {"ETH/BTC": 0.5},
+        "state": b"",
+    }
+    store_backtest_snapshot(filename, snapshot)
+    assert load_backtest_snapshot(filename, "abc") == snapshot
+    assert load_backtest_snapshot(filename, "def") is None
+
+    store_backtest_snapshot(filename, {**snapshot, "version": 0})
+    assert load_backtest_snapshot(filename, "abc") is None
+    assert log_has("Backtest snapshot was created by a different version, ignoring.", caplog)
+
+    filename.write_bytes(b"garbage")
+    assert load_backtest_snapshot(filename, "abc") is None
+    assert log_has_re(r"Could not load backtest snapshot .*", caplog)
@@ -25,6 +25,7 @@ from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.vectorized_backtest import VectorizedBacktest
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util import dt_now, dt_utc
@@ -1478,6 +1479,53 @@ def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir):
     assert len(results.loc[results["is_open"]]) == 0
 
 
+def test_backtest_incremental_wallets(default_conf, fee, mocker, testdatadir, caplog):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf["runmode"] = "backtest"
+    default_conf["timeframe"] = "5m"
+    default_conf["max_open_trades"] = 5
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _trend_alternate_hold
+    backtesting.strategy.advise_exit = _trend_alternate_hold
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    backtesting.wallets._verify = False
+    update_spy = mocker.spy(backtesting.wallets, "_update_dry")
+    results = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    assert len(results["results"]) > 20
+    # Full recalculation only at the start and the end of the backtest
+    assert update_spy.call_count == 2
+
+    backtesting.wallets._verify = True
+    results_verified = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    assert update_spy.call_count > 2 + len(results["results"])
+    assert not log_has_re(r"Backtest wallet aggregates differ from recalculation: .*", caplog)
+    assert results_verified["final_balance"] == results["final_balance"]
+    pd.testing.assert_frame_equal(results_verified["results"], results["results"])
+
+    # Mismatches are logged - and corrected from the full recalculation
+    backtesting.wallets._cross_margin += 0.1
+    backtesting.wallets.update_incremental("ETH/BTC")
+    assert log_has_re(r"Backtest wallet aggregates differ from recalculation: .*", caplog)
+    assert backtesting.wallets._cross_margin == 0.0
+
+
 @pytest.mark.parametrize("pair", ["ADA/BTC", "LTC/BTC"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
 def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir):
@@ -1586,6 +1634,98 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize(
+    "strategy_settings",
+    [
+        {"stoploss": -0.01, "minimal_roi": {0: 0.02, 30: 0.01, 60: 0}},
+        {"stoploss": -0.01, "minimal_roi": {0: 0.005}, "use_exit_signal": False},
+        {"stoploss": -0.02, "minimal_roi": {}, "trailing_stop": True},
+        {
+            "stoploss": -0.03,
+            "minimal_roi": {0: 0.1, 120: 0.005},
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.002,
+            "trailing_stop_positive_offset": 0.004,
+            "trailing_only_offset_is_reached": True,
+        },
+    ],
+)
+def test_backtest_vectorized(default_conf, fee, mocker, testdatadir, strategy_settings, caplog):
+    def _entry_exit(dataframe=None, metadata=None):
+        multi = 7 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 11
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where(dataframe.index % 47 == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf["runmode"] = "backtest"
+    default_conf["timeframe"] = "5m"
+    default_conf["max_open_trades"] = 3
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    for key, value in strategy_settings.items():
+        setattr(backtesting.strategy, key, value)
+    backtesting.strategy.advise_entry = _entry_exit
+    backtesting.strategy.advise_exit = _entry_exit
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    run_spy = mocker.spy(VectorizedBacktest, "run")
+
+    results = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    assert run_spy.call_count == 0
+    signal_cache: dict = {}
+    for _ in range(2):
+        results_vectorized = backtesting.backtest(
+            deepcopy(processed), min_date, max_date, signal_cache=signal_cache
+        )
+        assert len(results["results"]) > 5
+        pd.testing.assert_frame_equal(results_vectorized["results"], results["results"])
+        for key in ("rejected_signals", "canceled_trade_entries", "timedout_entry_orders"):
+            assert results_vectorized[key] == results[key]
+        assert results_vectorized["final_balance"] == pytest.approx(results["final_balance"])
+    assert run_spy.call_count == 2
+    if strategy_settings.get("trailing_stop_positive"):
+        assert "trailing_stop_loss" in results["results"]["exit_reason"].values
+
+    # Custom stoploss requires the full backtest loop
+    backtesting.strategy.use_custom_stoploss = True
+    results_fallback = backtesting.backtest(
+        deepcopy(processed), min_date, max_date, signal_cache=signal_cache
+    )
+    assert run_spy.call_count == 2
+    assert log_has(
+        "Vectorized backtesting is not supported with custom stoploss / custom roi.", caplog
+    )
+    backtesting.strategy.use_custom_stoploss = False
+
+    # Pairs starting later are supported
+    processed["LTC/BTC"] = processed["LTC/BTC"].iloc[30:]
+    results = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    results_vectorized = backtesting.backtest(
+        deepcopy(processed), min_date, max_date, signal_cache={}
+    )
+    assert run_spy.call_count == 3
+    pd.testing.assert_frame_equal(results_vectorized["results"], results["results"])
+
+    # Gaps in the data require the full backtest loop
+    processed["ETH/BTC"] = processed["ETH/BTC"].drop(processed["ETH/BTC"].index[200:210])
+    results_fallback = backtesting.backtest(processed, min_date, max_date, signal_cache={})
+    assert run_spy.call_count == 3
+    assert len(results_fallback["results"]) > 0
+    assert log_has(
+        "Vectorized backtesting is not supported with gaps in the data of ETH/BTC.", caplog
+    )
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
@@ -1,19 +1,30 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial, wraps
 from pathlib import Path
+from threading import Event
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pandas as pd
 import pytest
 from filelock import Timeout
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt import Hyperopt, hyperopt_optimizer
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import HyperoptIndicatorCache
+from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+from freqtrade.optimize.hyperopt.hyperopt_pruning import (
+    PRUNING_STARTUP_EPOCHS,
+    get_checkpoint_dates,
+    get_prune_thresholds,
+)
+from freqtrade.optimize.hyperopt_results_index import HyperoptResultsIndex
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
@@ -31,6 +42,12 @@ from tests.conftest import (
 )
 
 
+def completed_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
 def generate_result_metrics():
     return {
         "trade_count": 1,
@@ -324,6 +341,54 @@ def test_no_log_if_loss_does_not_improve(hyperopt, caplog) -> None:
     assert caplog.record_tuples == []
 
 
+@pytest.mark.parametrize("early_stop", [False, True])
+def test_run_epochs_streaming(hyperopt, mocker, early_stop) -> None:
+    hyperopt.total_epochs = 5
+    hyperopt.opt = MagicMock()
+    hyperopt.hyperopter.es_epochs = 1 if early_stop else 0
+    hyperopt.hyperopter.es_terminator = MagicMock()
+    hyperopt.hyperopter.es_terminator.should_terminate.side_effect = lambda _: early_stop
+    trials = [MagicMock(params={"x": i}) for i in range(5)]
+    mocker.patch.object(
+        hyperopt, "get_asked_points", side_effect=[([t], [False]) for t in trials] + [([], [])]
+    )
+    first_done = Event()
+    evaluated = []
+
+    def epoch(params):
+        if params["x"] == 0:
+            # The first epoch is slow - later epochs must not wait for it.
+            first_done.wait(timeout=10)
+        return {"loss": params["x"]}
+
+    def evaluate_result(val, current, is_random):
+        evaluated.append((val["loss"], current))
+        if len(evaluated) == (1 if early_stop else 3):
+            first_done.set()
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    mocker.patch.object(
+        hyperopt, "run_optimizer_parallel", side_effect=lambda ex, p: ex.submit(epoch, p)
+    )
+    mocker.patch.object(hyperopt, "evaluate_result", side_effect=evaluate_result)
+
+    hyperopt.run_epochs(executor, 2, MagicMock(), None, 0)
+    executor.shutdown()
+
+    if early_stop:
+        # Stops asking after the first result - the running epoch is still evaluated.
+        assert evaluated == [(1, 1), (0, 2)]
+        assert hyperopt.get_asked_points.call_count == 2
+    else:
+        assert evaluated[:3] == [(1, 1), (2, 2), (3, 3)]
+        assert sorted(evaluated[3:]) == [(0, 4), (4, 5)] or sorted(evaluated[3:]) == [
+            (0, 5),
+            (4, 4),
+        ]
+        assert hyperopt.opt.tell.call_count == 5
+        hyperopt.opt.tell.assert_any_call(trials[0], 0)
+
+
 def test_roi_table_generation(hyperopt) -> None:
     params = {
         "roi_t1": 5,
@@ -378,14 +443,14 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
                     "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -561,7 +626,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load",
+        return_value={"XRP/BTC": pd.DataFrame()},
     )
 
     optimizer_param = {
@@ -640,7 +706,7 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -664,7 +730,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
@@ -679,7 +745,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
                     },
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -730,7 +796,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
@@ -743,7 +809,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
                     },
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -787,7 +853,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
@@ -795,7 +861,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
                     "params_details": {"roi": {}, "stoploss": {"stoploss": None}},
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -842,14 +908,14 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
                     "params": {"stoploss": 0.0},
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -935,14 +1001,14 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
                     "params": {},
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -989,14 +1055,14 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     parallel = mocker.patch(
         "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
         MagicMock(
-            return_value=[
+            return_value=completed_future(
                 {
                     "loss": 1,
                     "results_explanation": "foo result",
                     "params": {},
                     "results_metrics": generate_result_metrics(),
                 }
-            ]
+            )
         ),
     )
     patch_exchange(mocker)
@@ -1363,3 +1429,333 @@ def test_max_open_trades_consistency(mocker, hyperopt_conf, tmp_path, fee) -> No
 
     assert hyperopt.hyperopter.backtesting.strategy.max_open_trades == 4
     assert hyperopt.config["max_open_trades"] == 4
+
+
+@pytest.mark.parametrize("analyze_per_epoch", [False, True])
+def test_hyperopt_resident_data(mocker, hyperopt_conf, tmp_path, fee, analyze_per_epoch) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "spaces": ["roi", "stoploss"],
+            "analyze_per_epoch": analyze_per_epoch,
+        }
+    )
+
+    def prepared_optimizer():
+        hyperopt = Hyperopt(hyperopt_conf)
+        opt = hyperopt.hyperopter
+        opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+        opt.prepare_hyperopt()
+        opt.get_optimizer(42)
+        return opt
+
+    opt = prepared_optimizer()
+    assert opt._signal_cache == {}
+    load_spy = mocker.spy(hyperopt_optimizer, "load")
+    signals_spy = mocker.spy(opt.backtesting, "_get_ohlcv_as_lists")
+    indicators_spy = mocker.spy(opt.backtesting.strategy, "advise_all_indicators")
+    params = [
+        {"roi_t1": 20, "roi_t2": 30, "roi_t3": 40, "roi_p1": 0.01, "roi_p2": 0.01, "roi_p3": 0.1}
+        | {"stoploss": sl}
+        for sl in (-0.05, -0.2, -0.05)
+    ]
+    results = [opt.generate_optimizer(p) for p in params]
+    # Data is loaded and converted once - indicators don't depend on roi / stoploss.
+    assert load_spy.call_count == 1
+    assert signals_spy.call_count == 1
+    assert indicators_spy.call_count == (1 if analyze_per_epoch else 0)
+    assert results[0]["results_metrics"]["total_trades"] > 0
+    assert results[0]["loss"] == results[2]["loss"]
+    assert results[0]["loss"] != results[1]["loss"]
+
+    # Identical results without caching
+    opt_uncached = prepared_optimizer()
+    opt_uncached._signal_cache = None
+    for p, result in zip(params, results, strict=True):
+        opt_uncached._processed = None
+        opt_uncached._indicator_cache = opt_uncached._new_indicator_cache()
+        assert opt_uncached.generate_optimizer(p)["loss"] == result["loss"]
+
+    # Caches are not sent to worker processes
+    state = opt.__getstate__()
+    assert state["_processed"] is None
+    assert state["_signal_cache"] == {}
+    assert len(state["_indicator_cache"]) == 0
+    assert opt._processed is not None
+
+
+def test_hyperopt_indicator_cache(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    period = IntParameter(low=5, high=20, default=10, space="buy")
+    threshold = IntParameter(low=0, high=50, default=30, space="buy")
+    df = pd.DataFrame({"close": range(1000)})
+    calls = []
+
+    def analyze():
+        calls.append(period.value)
+        return {"ETH/BTC": df.copy()}
+
+    entry_size = int(df.memory_usage(index=True).sum())
+    cache = HyperoptIndicatorCache(entry_size * 2)
+    first = cache.get(analyze)
+    # Only parameters read while analyzing are part of the key
+    threshold.value = 20
+    assert cache.get(analyze) is first
+    period.value = 15
+    second = cache.get(analyze)
+    assert second is not first
+    period.value = 10
+    assert cache.get(analyze) is first
+    assert calls == [10, 15]
+
+    # Least recently used entry is evicted
+    period.value = 20
+    cache.get(analyze)
+    assert len(cache) == 2
+    period.value = 15
+    cache.get(analyze)
+    assert calls == [10, 15, 20, 15]
+    period.value = 20
+    cache.get(analyze)
+    assert len(calls) == 4
+
+    # Entries exceeding the limit are kept until replaced
+    cache = HyperoptIndicatorCache(1)
+    cache.get(analyze)
+    assert len(cache) == 1
+
+    # Indicators of the test strategy don't depend on buy parameters
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "spaces": ["buy"], "analyze_per_epoch": True})
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    opt.get_optimizer(42)
+    indicators_spy = mocker.spy(opt.backtesting.strategy, "advise_all_indicators")
+    for buy_rsi in (20, 35, 40):
+        opt.generate_optimizer({"buy_rsi": buy_rsi, "buy_plusdi": 0.5})
+    assert indicators_spy.call_count == 1
+
+
+def test_hyperopt_encode_data(tmp_path) -> None:
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=4, freq="5min", tz="UTC"),
+            "close": [1.0, 2.0, 3.0, 4.0],
+            "trend": ["up", "down", "down", "up"],
+            "mixed": [1, "a", 2.0, None],
+            "tag": ["a", None, "b", "a"],
+        }
+    )
+    encoded = HyperOptimizer._encode_data({"ETH/BTC": df})["ETH/BTC"]
+    assert encoded["trend"].dtype == "category"
+    assert encoded["mixed"].dtype == object
+    assert encoded["tag"].dtype == object
+    assert "ft_encoded_columns" not in df.attrs
+
+    filename = tmp_path / "data.pkl"
+    hyperopt_optimizer.dump({"ETH/BTC": encoded}, filename)
+    with filename.open("rb") as f:
+        data = HyperOptimizer._decode_data(hyperopt_optimizer.load(f, mmap_mode="r"))
+    result = data["ETH/BTC"]
+    pd.testing.assert_frame_equal(result, df)
+    assert result.attrs == {}
+    # Strings are shared between rows
+    assert result["trend"].iloc[0] is result["trend"].iloc[3]
+
+
+def test_hyperopt_summary_stats(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "spaces": ["stoploss"],
+            "hyperopt_loss": "SharpeHyperOptLoss",
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    opt.get_optimizer(42)
+    stats_spy = mocker.spy(hyperopt_optimizer, "generate_strategy_stats")
+    params = {"stoploss": -0.05}
+
+    full = opt.generate_optimizer(params)
+    assert stats_spy.call_count == 1
+    assert "results_per_pair" in full["results_metrics"]
+
+    # Not better than the best loss - summary only
+    summary = opt.generate_optimizer(params, best_loss=full["loss"])
+    assert stats_spy.call_count == 1
+    assert summary["loss"] == full["loss"]
+    assert summary["results_explanation"] == full["results_explanation"]
+    metrics = summary["results_metrics"]
+    assert "results_per_pair" not in metrics
+    assert metrics["total_trades"] > 0
+    for key, value in metrics.items():
+        assert full["results_metrics"][key] == value, key
+
+    # Candidate for the best epoch
+    best = opt.generate_optimizer(params, best_loss=full["loss"] + 1)
+    assert stats_spy.call_count == 2
+    assert best["results_metrics"].keys() == full["results_metrics"].keys()
+
+    # Loss functions requiring other metrics always get full stats
+    mocker.patch.object(opt.custom_hyperoptloss, "required_metrics", ("results_per_pair",))
+    opt.generate_optimizer(params, best_loss=full["loss"])
+    assert stats_spy.call_count == 3
+
+
+def test_hyperopt_shared_study(mocker, hyperopt_conf, tmp_path, caplog) -> None:
+    patch_exchange(mocker)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "spaces": ["stoploss"],
+            "hyperopt_storage": f"sqlite:///{tmp_path / 'hyperopt.sqlite'}",
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.prepare_hyperopt()
+    with pytest.raises(OperationalException, match=r"`--study-name` is required"):
+        hyperopt.hyperopter.get_optimizer(42)
+
+    hyperopt_conf["hyperopt_study_name"] = "test_study"
+    hyperopt.opt = hyperopt.hyperopter.get_optimizer(42)
+    assert log_has("Joined study test_study with 0 existing trials.", caplog)
+    trial = hyperopt.opt.ask(hyperopt.hyperopter.o_dimensions)
+    val = {"loss": 1.5, "results_metrics": {"total_trades": 3, "profit_total": 0.1}}
+    hyperopt.tell_result(trial, val)
+
+    # A second process joins the study and sees the results of the first one
+    other = Hyperopt(hyperopt_conf)
+    other.hyperopter.prepare_hyperopt()
+    study = other.hyperopter.get_optimizer(43)
+    assert log_has("Joined study test_study with 1 existing trials.", caplog)
+    assert study.best_value == 1.5
+    assert study.trials[0].user_attrs["ft_results_metrics"] == {
+        "total_trades": 3,
+        "profit_total": 0.1,
+    }
+
+    # Studies are bound to the dimensions they were created with
+    hyperopt_conf["spaces"] = ["roi"]
+    other = Hyperopt(hyperopt_conf)
+    other.hyperopter.prepare_hyperopt()
+    with pytest.raises(OperationalException, match=r"Study test_study was created with different"):
+        other.hyperopter.get_optimizer(44)
+
+
+def test_hyperopt_resume(mocker, hyperopt_conf, tmp_path, fee, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy", "stoploss"],
+            "epochs": 3,
+        }
+    )
+    hyperopt_conf["hyperopt_resume"] = True
+    with pytest.raises(OperationalException, match=r"Hyperopt results file .* not found"):
+        Hyperopt(hyperopt_conf)
+
+    del hyperopt_conf["hyperopt_resume"]
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.start()
+    results_file = hyperopt.results_file
+    assert hyperopt.num_epochs_saved == 3
+    # Simulate an epoch interrupted while writing
+    with results_file.open("ab") as f:
+        f.write(b'{"loss": 1')
+
+    hyperopt_conf.update({"hyperopt_resume": True, "epochs": 5})
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.results_file == results_file
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    evaluate_spy = mocker.spy(hyperopt, "evaluate_result")
+    hyperopt.start()
+    assert log_has(f"Removing incomplete last epoch from {results_file}.", caplog)
+    assert log_has(f"Resuming from 3 epochs in '{results_file}'.", caplog)
+    # Only the missing epochs are evaluated
+    assert [c.args[1] for c in evaluate_spy.call_args_list] == [4, 5]
+    completed = hyperopt.opt.get_trials(states=[TrialState.COMPLETE])
+    assert len(completed) == 5
+    assert hyperopt.current_best_epoch is not None
+
+    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, hyperopt_conf)
+    assert total_epochs == 5
+    assert [e["current_epoch"] for e in epochs] == [1, 2, 3, 4, 5]
+    # Index was rebuilt after removing the incomplete epoch
+    assert HyperoptResultsIndex.load_epochs(results_file) is not None
+
+    hyperopt_conf["spaces"] = ["buy"]
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    with pytest.raises(OperationalException, match=r"created with different spaces"):
+        hyperopt.start()
+
+
+def test_hyperopt_pruning(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "spaces": ["stoploss"],
+            "prune_checkpoints": 2,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    hyperopt.opt = opt.get_optimizer(42)
+    params = {"stoploss": -0.05}
+
+    assert get_checkpoint_dates(dt_utc(2024, 1, 1), dt_utc(2024, 1, 4), 2) == [
+        dt_utc(2024, 1, 2),
+        dt_utc(2024, 1, 3),
+    ]
+    # Not enough completed epochs to prune yet
+    assert get_prune_thresholds(hyperopt.opt, 2) == [None, None]
+    full = opt.generate_optimizer(params, prune_thresholds=[None, None])
+    assert "is_pruned" not in full
+    assert len(full["intermediate_values"]) == 2
+    assert opt.backtesting.abort_callback is None
+
+    for _ in range(PRUNING_STARTUP_EPOCHS):
+        trial = hyperopt.opt.ask(opt.o_dimensions)
+        hyperopt.tell_result(trial, full)
+    assert get_prune_thresholds(hyperopt.opt, 2) == full["intermediate_values"]
+
+    # Below the median at the first checkpoint
+    pruned = opt.generate_optimizer(params, prune_thresholds=[1e9, None])
+    assert pruned["is_pruned"] is True
+    assert pruned["loss"] == hyperopt_optimizer.MAX_LOSS
+    assert pruned["intermediate_values"] == full["intermediate_values"][:1]
+    assert pruned["results_metrics"]["total_trades"] <= full["results_metrics"]["total_trades"]
+    assert opt.backtesting.abort_callback is None
+
+    trial = hyperopt.opt.ask(opt.o_dimensions)
+    hyperopt.tell_result(trial, pruned)
+    frozen = hyperopt.opt.trials[-1]
+    assert frozen.state == TrialState.PRUNED
+    assert frozen.intermediate_values == {0: pruned["intermediate_values"][0]}
+    # Pruned epochs don't affect the thresholds
+    assert get_prune_thresholds(hyperopt.opt, 2) == full["intermediate_values"]
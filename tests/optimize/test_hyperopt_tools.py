@@ -1,5 +1,6 @@
 import logging
 import re
+from datetime import timedelta
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +9,7 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_results_index import get_index_filename
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -53,6 +55,61 @@ def test_save_results_saves_epochs(hyperopt, tmp_path, caplog) -> None:
         next(result_gen)
 
 
+def test_save_results_index(hyperopt, tmp_path, caplog) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    index_file = get_index_filename(hyperopt.results_file)
+    for i in range(4):
+        hyperopt._save_result(
+            {
+                "loss": 1.0 - i,
+                "current_epoch": i + 1,
+                "is_initial_point": i == 0,
+                "is_random": False,
+                "is_best": i % 2 == 0,
+                "params_dict": {"stoploss": -0.1},
+                "results_metrics": {
+                    "total_trades": np.int64(10 * i),
+                    "profit_total_abs": 0.5 * i,
+                    "holding_avg": timedelta(minutes=30),
+                    "results_per_pair": [{"key": "ETH/BTC"}],
+                },
+            }
+        )
+    hyperopt.results_index.close()
+    assert index_file.is_file()
+
+    config = {"hyperopt_list_best": True}
+    epochs, total = HyperoptTools.load_filtered_results(hyperopt.results_file, config)
+    assert total == 4
+    assert [e["current_epoch"] for e in epochs] == [1, 3]
+    assert epochs[1]["results_metrics"] == {
+        "total_trades": 20,
+        "profit_total_abs": 1.0,
+        "holding_avg": "0:30:00",
+    }
+    assert epochs[1]["is_best"] is True
+    assert epochs[1]["loss"] == -1.0
+    assert "params_dict" not in epochs[1]
+
+    full_epochs = HyperoptTools.load_full_epochs(hyperopt.results_file, epochs)
+    assert full_epochs[1]["params_dict"] == {"stoploss": -0.1}
+    assert full_epochs[1]["results_metrics"]["results_per_pair"] == [{"key": "ETH/BTC"}]
+    assert HyperoptTools.load_full_epochs(hyperopt.results_file, full_epochs) == full_epochs
+
+    # Epochs missing in the index - results file is read
+    with hyperopt.results_file.open("a") as f:
+        f.write(hyperopt.results_file.read_text().splitlines()[0] + "\n")
+    epochs, total = HyperoptTools.load_filtered_results(hyperopt.results_file, config)
+    assert log_has_re(r"Hyperopt results index .* is outdated, ignoring\.", caplog)
+    assert total == 5
+    assert epochs[:2] == full_epochs
+
+    index_file.write_text("garbage")
+    epochs, total = HyperoptTools.load_filtered_results(hyperopt.results_file, config)
+    assert log_has_re(r"Could not read hyperopt results index .*", caplog)
+    assert total == 5
+
+
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
     results_file = testdatadir / "hyperopt_results_SampleStrategy.pickle"
     with pytest.raises(
@@ -0,0 +1,164 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103, unused-argument
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data import history
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType
+from freqtrade.optimize.backtest_caching import get_strategy_indicator_id
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.indicator_cache import IndicatorCache
+from freqtrade.resolvers import StrategyResolver
+from tests.conftest import log_has, log_has_re, patch_exchange
+
+
+def _load_strategy(conf):
+    strategy = StrategyResolver.load_strategy(conf)
+    strategy.dp = DataProvider(conf, None)
+    strategy.ft_bot_start()
+    return strategy
+
+
+def _load_data(testdatadir, pairs=None):
+    return history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=pairs or ["UNITTEST/BTC"],
+        timerange=TimeRange.parse_timerange("20180110-20180120"),
+    )
+
+
+def test_get_strategy_indicator_id(default_conf):
+    strategy = _load_strategy(default_conf)
+    x = get_strategy_indicator_id(strategy)
+    assert isinstance(x, str)
+
+    # Settings that don't influence indicators keep the id
+    strategy.config["timerange"] = "20200101-"
+    strategy.config["stake_amount"] = 0.05
+    strategy.config["minimal_roi"] = {"0": 0.5}
+    assert get_strategy_indicator_id(strategy) == x
+
+    strategy.buy_rsi.value = 22
+    y = get_strategy_indicator_id(strategy)
+    assert y != x
+    strategy.config["timeframe"] = "1h"
+    z = get_strategy_indicator_id(strategy)
+    assert z != y
+    # Any other config value may be used by populate_indicators()
+    strategy.config["my_custom_setting"] = 5
+    assert get_strategy_indicator_id(strategy) != z
+
+
+def test_indicator_cache_hit(default_conf, testdatadir, tmp_path, caplog, mocker):
+    default_conf["user_data_dir"] = tmp_path
+    strategy = _load_strategy(default_conf)
+    spy = mocker.spy(strategy, "advise_indicators")
+    data = _load_data(testdatadir, ["UNITTEST/BTC", "ETH/BTC"])
+
+    cache = IndicatorCache(default_conf, strategy)
+    assert cache.enabled
+    res = cache.advise_all_indicators(data)
+    assert spy.call_count == 2
+    assert list(res.keys()) == ["UNITTEST/BTC", "ETH/BTC"]
+    assert log_has("Loaded indicators for 0 of 2 pairs from cache.", caplog)
+    assert len(list((tmp_path / "cache" / "indicator_cache").glob("*.feather"))) == 2
+
+    caplog.clear()
+    cache = IndicatorCache(default_conf, strategy)
+    res1 = cache.advise_all_indicators(data)
+    assert spy.call_count == 2
+    assert log_has("Loaded indicators for 2 of 2 pairs from cache.", caplog)
+    for pair in data:
+        pd.testing.assert_frame_equal(res[pair], res1[pair])
+
+    # A different timerange is selected from the cached data
+    data["ETH/BTC"] = data["ETH/BTC"].iloc[20:-10].reset_index(drop=True)
+    res2 = cache.advise_all_indicators(data)
+    assert spy.call_count == 2
+    assert len(res2["ETH/BTC"]) == len(res["ETH/BTC"]) - 30
+    pd.testing.assert_frame_equal(
+        res2["ETH/BTC"], res["ETH/BTC"].iloc[20:-10].reset_index(drop=True)
+    )
+
+    # Changed data file results in a cache miss for this pair only
+    with patch.object(cache, "_file_signature", return_value=["ETH_BTC-5m.feather", 1, 2]):
+        cache.advise_all_indicators({"ETH/BTC": data["ETH/BTC"]})
+    assert spy.call_count == 3
+
+    # Changed parameter values result in a cache miss
+    strategy.buy_rsi.value = 12
+    cache = IndicatorCache(default_conf, strategy)
+    cache.advise_all_indicators(data)
+    assert spy.call_count == 5
+
+
+def test_indicator_cache_informative(default_conf, testdatadir, tmp_path, mocker):
+    default_conf["user_data_dir"] = tmp_path
+    strategy = _load_strategy(default_conf)
+    mocker.patch.object(
+        strategy, "gather_informative_pairs", return_value=[("ETH/BTC", "5m", CandleType.SPOT)]
+    )
+    spy = mocker.spy(strategy, "advise_indicators")
+    data = _load_data(testdatadir)
+
+    cache = IndicatorCache(default_conf, strategy)
+    assert not cache._full_history
+    cache.advise_all_indicators(data)
+    assert spy.call_count == 1
+    assert len(data["UNITTEST/BTC"]) == len(cache.advise_all_indicators(data)["UNITTEST/BTC"])
+    assert spy.call_count == 1
+
+    # Cached per timerange
+    data["UNITTEST/BTC"] = data["UNITTEST/BTC"].iloc[:-10]
+    cache.advise_all_indicators(data)
+    assert spy.call_count == 2
+
+
+def test_indicator_cache_evict(default_conf, testdatadir, tmp_path, caplog):
+    default_conf["user_data_dir"] = tmp_path
+    strategy = _load_strategy(default_conf)
+    data = _load_data(testdatadir, ["UNITTEST/BTC", "ETH/BTC"])
+    cache = IndicatorCache(default_conf, strategy)
+    cache.advise_all_indicators(data)
+    cache_dir = tmp_path / "cache" / "indicator_cache"
+    files = sorted(cache_dir.glob("*.feather"), key=lambda f: f.stat().st_mtime_ns)
+    assert len(files) == 2
+
+    # Only the most recently used entry fits
+    cache._max_size = files[-1].stat().st_size
+    cache.evict()
+    assert log_has("Removed 1 entries from the indicator cache.", caplog)
+    assert list(cache_dir.glob("*.feather")) == [files[-1]]
+
+
+def test_indicator_cache_not_supported(default_conf, testdatadir, tmp_path, caplog, mocker):
+    default_conf["user_data_dir"] = tmp_path
+    strategy = _load_strategy(default_conf)
+    default_conf["freqai"] = {"enabled": True}
+    data = _load_data(testdatadir)
+    advise_mock = mocker.patch.object(strategy, "advise_all_indicators", return_value=data)
+
+    cache = IndicatorCache(default_conf, strategy)
+    assert not cache.enabled
+    assert log_has_re(r"Indicator cache is not supported in combination with FreqAI\.", caplog)
+    assert cache.advise_all_indicators(data) == data
+    assert advise_mock.call_count == 1
+    assert not (tmp_path / "cache").exists()
+
+
+def test_backtest_one_strategy_indicator_cache(default_conf, testdatadir, tmp_path, mocker):
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["backtest_indicator_cache"] = True
+    default_conf["timerange"] = "20180110-20180120"
+    patch_exchange(mocker)
+    cache_mock = MagicMock(side_effect=lambda data: data)
+    mocker.patch("freqtrade.optimize.backtesting.IndicatorCache.advise_all_indicators", cache_mock)
+    mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest", return_value={})
+    backtesting = Backtesting(default_conf)
+    data, timerange = backtesting.load_bt_data()
+    backtesting.backtest_one_strategy(backtesting.strategylist[0], data, timerange)
+    assert cache_mock.call_count == 1
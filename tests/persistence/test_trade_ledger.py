@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from freqtrade.data.btanalysis import trade_list_to_dataframe
+from freqtrade.persistence import LedgerTrade, LocalTrade, Trade, TradeLedger
+from freqtrade.util import dt_ts
+from tests.conftest import create_mock_trades
+
+
+def _closed_trades(fee, is_short):
+    Trade.use_db = False
+    Trade.reset_trades()
+    create_mock_trades(fee, is_short, use_db=False)
+    trades = LocalTrade.bt_trades
+    Trade.use_db = True
+    return trades
+
+
+@pytest.mark.parametrize("is_short", [True, False])
+def test_trade_ledger(fee, is_short):
+    trades = _closed_trades(fee, is_short)
+    assert len(trades) == 2
+    ledger = TradeLedger()
+    for trade in trades:
+        ledger.append(trade)
+
+    assert len(ledger) == 2
+    ledger_trade = ledger[0]
+    assert isinstance(ledger_trade, LedgerTrade)
+    assert ledger[-1].id == trades[1].id
+    with pytest.raises(IndexError):
+        ledger[2]
+    for trade, ledger_trade in zip(trades, ledger, strict=True):
+        assert ledger_trade.pair == trade.pair
+        # Dates are stored with millisecond resolution
+        assert dt_ts(ledger_trade.close_date) == dt_ts(trade.close_date_utc)
+        assert dt_ts(ledger_trade.open_date) == dt_ts(trade.open_date_utc)
+        assert ledger_trade.close_profit == trade.close_profit
+        assert ledger_trade.close_profit_abs == trade.close_profit_abs
+        assert ledger_trade.exit_reason == trade.exit_reason
+        assert ledger_trade.trade_direction == trade.trade_direction
+        assert ledger_trade.nr_of_successful_entries == trade.nr_of_successful_entries
+        assert ledger_trade.to_json(True) == trade.to_json(True)
+        assert not ledger_trade.is_open
+        assert ledger_trade.open_orders == []
+    with pytest.raises(AttributeError, match=r"'LedgerTrade' object has no attribute 'xyz'"):
+        _ = ledger_trade.xyz
+
+    df = trade_list_to_dataframe(ledger)
+    df_trades = trade_list_to_dataframe(trades)
+    pd.testing.assert_frame_equal(df.drop(columns="orders"), df_trades.drop(columns="orders"))
+    assert df["orders"].tolist() == df_trades["orders"].tolist()
+    assert ledger.column("close_profit_abs") == [t.close_profit_abs for t in trades]
+
+
+def test_trade_ledger_select(fee):
+    trades = _closed_trades(fee, False)
+    ledger = TradeLedger()
+    for trade in trades:
+        ledger.append(trade)
+
+    assert len(ledger.select()) == 2
+    assert [t.pair for t in ledger.select(pair="ETC/BTC")] == ["ETC/BTC"]
+    assert ledger.select(pair="NEO/BTC") == []
+
+    first, second = sorted(trades, key=lambda t: t.close_date_utc)
+    res = ledger.select(close_date=first.close_date_utc)
+    assert [t.id for t in res] == [second.id]
+    res = ledger.select(close_date=first.close_date_utc - timedelta(seconds=1))
+    assert len(res) == 2
+    res = ledger.select(open_date=second.open_date_utc - timedelta(seconds=1))
+    assert second.id in [t.id for t in res]
+
+    # Close dates out of order
+    ledger.append(first)
+    assert not ledger._close_sorted
+    assert len(ledger.select(close_date=first.close_date_utc)) == 1
+
+
+def test_get_trades_proxy_ledger(fee):
+    trades = _closed_trades(fee, False)
+    Trade.use_db = False
+    Trade.reset_trades(use_ledger=True)
+    for trade in trades:
+        LocalTrade.add_bt_trade(trade)
+    assert isinstance(LocalTrade.bt_trades, TradeLedger)
+
+    res = Trade.get_trades_proxy(is_open=False)
+    assert len(res) == 2
+    assert all(isinstance(t, LedgerTrade) for t in res)
+    assert len(Trade.get_trades_proxy(is_open=False, pair="ETC/BTC")) == 1
+    assert len(Trade.get_trades_proxy()) == 2
+    assert Trade.get_total_closed_profit() == pytest.approx(sum(t.close_profit_abs for t in trades))
+    Trade.reset_trades()
+    assert LocalTrade.bt_trades == []
+    Trade.use_db = True
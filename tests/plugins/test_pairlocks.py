@@ -158,3 +158,53 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.parametrize("use_db", (False, True))
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_index(use_db):
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = use_db
+    start = datetime(2021, 1, 1, tzinfo=UTC)
+    for i in range(50):
+        # Locks with out-of-order end times
+        PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=(i * 7) % 50), now=start)
+    PairLocks.lock_pair("*", start + timedelta(minutes=100), now=start, side="short")
+
+    for minute in (0, 12, 33, 49, 55):
+        now = start + timedelta(minutes=minute)
+        locks = PairLocks.get_pair_locks("ETH/BTC", now)
+        expected = [
+            lock
+            for lock in PairLocks.get_all_locks()
+            if lock.pair == "ETH/BTC" and lock.lock_end_time.replace(tzinfo=UTC) > now
+        ]
+        assert len(locks) == len(expected)
+        assert PairLocks.is_pair_locked("ETH/BTC", now) == (len(expected) > 0)
+        assert PairLocks.is_pair_locked("ETH/BTC", now, side="short")
+        assert not PairLocks.is_pair_locked("XRP/BTC", now, side="long")
+    assert len(PairLocks.get_pair_locks(None, start)) == 51
+
+    PairLocks.unlock_pair("ETH/BTC", start)
+    assert not PairLocks.is_pair_locked("ETH/BTC", start, side="long")
+    assert PairLocks.is_pair_locked("ETH/BTC", start, side="short")
+    assert len(PairLocks.get_all_locks()) == 51
+
+    if not use_db:
+        assert len(PairLocks._lock_index["ETH/BTC"]) == 0
+        assert len(PairLocks._lock_index[None]) == 1
+        # Replacing the locks (e.g. when restoring a backtest) rebuilds the index
+        PairLocks.locks = [
+            PairLock(
+                pair="XRP/BTC",
+                lock_time=start,
+                lock_end_time=start + timedelta(minutes=10),
+                side="*",
+                active=True,
+            )
+        ]
+        assert PairLocks.is_pair_locked("XRP/BTC", start)
+        assert not PairLocks.is_pair_locked("ETH/BTC", start)
+
+    PairLocks.reset_locks()
+    PairLocks.use_db = True
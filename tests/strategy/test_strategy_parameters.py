@@ -12,6 +12,7 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    trace_parameter_access,
 )
 
 
@@ -134,3 +135,19 @@ def test_hyperopt_categorical_parameter():
     HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
     assert len(list(catpar.range)) == 1
     assert len(list(boolpar.range)) == 1
+
+
+def test_trace_parameter_access():
+    intpar = IntParameter(low=0, high=5, default=1, space="buy")
+    decimalpar = DecimalParameter(low=0.0, high=0.5, default=0.14, decimals=1, space="buy")
+    boolpar = BooleanParameter(default=True, space="sell")
+
+    with trace_parameter_access() as outer:
+        assert list(intpar.range) == [1]
+        with trace_parameter_access() as inner:
+            assert decimalpar.value == 0.1
+        assert inner == {decimalpar}
+    # Nested access is also recorded in the outer trace
+    assert outer == {intpar, decimalpar}
+    assert boolpar.value is True
+    assert boolpar not in outer